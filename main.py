@@ -1,4 +1,3 @@
-import inspect
 import os
 import signal
 
@@ -20,6 +19,7 @@ from src import (
     Storage,
     Validator,
 )
+from src.cmd import handler_params
 from src.prompt import CLIPromptSession
 
 
@@ -176,13 +176,14 @@ def run_cli(ctx: CLIContext):
             handler = COMMAND_MAP.get(command)
 
             if handler:
+                ctx.begin_command()
+
                 # Check if handler accepts the provided parameters
-                sig = inspect.signature(handler)
-                handler_params = set(sig.parameters.keys()) - {'ctx'}
+                accepted = handler_params(handler)
                 if params:
                     # Filter params to only include those the handler accepts
-                    valid_params = {k: v for k, v in params.items() if k in handler_params}
-                    invalid_params = set(params.keys()) - handler_params
+                    valid_params = {k: v for k, v in params.items() if k in accepted}
+                    invalid_params = set(params.keys()) - accepted
 
                     if invalid_params:
                         print(f"Warning: Command '{command}' doesn't support parameters: {', '.join(invalid_params)}")
@@ -1,13 +1,15 @@
-import json
+import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .models import Artist, Post, Profile, Config
 from .logger import Logger
 from .filters import PostFilter
 from .storage import Storage
+from .utils import Utils
 
 
 class Cache:
@@ -45,7 +47,7 @@ class Cache:
         profile.cached_at = datetime.now().isoformat()
 
         path = self._profile_path(artist_id)
-        path.write_text(json.dumps(profile.__dict__, indent=2, ensure_ascii=False), encoding='utf-8')
+        Utils.write_json(path, profile.__dict__)
 
     def save_profile(self, artist_id: str, profile_data: Dict):
         with self.lock:
@@ -58,7 +60,7 @@ class Cache:
             return None
 
         try:
-            data = json.loads(path.read_text(encoding='utf-8'))
+            data = Utils.read_json(path)
             return Profile(**data)
         except Exception:
             return None
@@ -71,7 +73,7 @@ class Cache:
         """Internal: Save posts without lock (not thread-safe)"""
         path = self._posts_path(artist_id)
         data = [post.__dict__ for post in posts]
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+        Utils.write_json(path, data)
 
     def save_posts(self, artist_id: str, posts: List[Post]):
         with self.lock:
@@ -84,7 +86,7 @@ class Cache:
             return []
 
         try:
-            data = json.loads(path.read_text(encoding='utf-8'))
+            data = Utils.read_json(path)
             posts = [Post(**item) for item in data]
 
             if not apply_filters:
@@ -119,6 +121,35 @@ class Cache:
         with self.lock:
             return self._load_posts(artist_id, apply_filters)
 
+    def load_posts_many(self, artist_ids: List[str], apply_filters: bool = True) -> Dict[str, List[Post]]:
+        """Load posts for multiple artists in one locked pass
+
+        One directory scan finds the cache files that exist, instead of a stat per artist.
+        The files are then read on a small thread pool while the lock is held: the lock
+        keeps writers out, and the workers read without it, so file reads overlap.
+
+        Returns:
+            Posts per artist ID, for artists that have any
+        """
+        with self.lock:
+            with os.scandir(self.cache_dir) as entries:
+                names = {entry.name for entry in entries}
+            cached_ids = [artist_id for artist_id in artist_ids if self._posts_path(artist_id).name in names]
+            if not cached_ids:
+                return {}
+
+            with ThreadPoolExecutor(max_workers=min(8, len(cached_ids))) as executor:
+                results = executor.map(lambda artist_id: self._load_posts(artist_id, apply_filters), cached_ids)
+                return {artist_id: posts for artist_id, posts in zip(cached_ids, results) if posts}
+
+    def has_posts(self, artist_id: str) -> bool:
+        """Check whether any posts are cached, without parsing the cache file"""
+        try:
+            # An empty cache is saved as "[]"
+            return self._posts_path(artist_id).stat().st_size > len("[]")
+        except FileNotFoundError:
+            return False
+
     def update_post(self, artist_id: str, post_id: str, done: bool, failed_files: List[str] = None, content: str = None):
         with self.lock:
             posts = self._load_posts(artist_id)
@@ -139,14 +170,21 @@ class Cache:
     def stats(self, artist_id: str) -> Dict:
         posts = self.load_posts(artist_id)
         total = len(posts)
-        done = sum(1 for p in posts if p.done)
-        failed = sum(1 for p in posts if p.failed_files)
+        done = failed = undone = 0
+        for p in posts:
+            if p.done:
+                done += 1
+            if p.failed_files:
+                failed += 1
+            if not p.done or p.failed_files:
+                undone += 1
 
         return {
             'total': total,
             'done': done,
             'pending': total - done,
-            'failed': failed
+            'failed': failed,
+            'undone': undone
         }
 
     def has_new(self, artist_id: str, current_count: int) -> bool:
@@ -155,10 +193,29 @@ class Cache:
             return True
         return current_count > profile.post_count
 
+    def _get_undone(self, artist_id: str) -> List[Post]:
+        """Internal: Get undone posts without lock (not thread-safe)"""
+        posts = self._load_posts(artist_id)
+        return [post for post in posts if not post.done or post.failed_files]
+
     def get_undone(self, artist_id: str) -> List[Post]:
         """Get undone posts (not done or has failed files)"""
-        posts = self.load_posts(artist_id)
-        return [post for post in posts if not post.done or post.failed_files]
+        with self.lock:
+            return self._get_undone(artist_id)
+
+    def get_undone_bulk(self, artist_ids: List[str]) -> Dict[str, List[Post]]:
+        """Get undone posts for multiple artists in one locked pass
+
+        Returns:
+            Undone posts per artist ID, for artists that have any
+        """
+        undone = {}
+        with self.lock:
+            for artist_id in artist_ids:
+                posts = self._get_undone(artist_id)
+                if posts:
+                    undone[artist_id] = posts
+        return undone
 
     def mark_old_done(self, artist_id: str, before_date: str):
         with self.lock:
@@ -168,6 +225,36 @@ class Cache:
                     post.done = True
             self._save_posts(artist_id, posts)
 
+    def _reset_after_date(self, artist_id: str, after_date: str = None) -> int:
+        """Internal: Reset posts to undone without lock (not thread-safe)"""
+        posts = self._load_posts(artist_id)
+        if not posts:
+            return 0
+
+        reset_count = 0
+        for post in posts:
+            # Skip if published is None
+            if not post.published:
+                continue
+
+            # If no date specified, reset all done posts
+            if not after_date:
+                if post.done:
+                    post.done = False
+                    post.failed_files = []
+                    reset_count += 1
+            # Otherwise, reset posts after the date
+            elif post.published > after_date and post.done:
+                post.done = False
+                post.failed_files = []
+                reset_count += 1
+
+        if reset_count > 0:
+            self._save_posts(artist_id, posts)
+            self.logger.cache_reset_after_date(artist_id=artist_id, after_date=after_date or '', count=reset_count)
+
+        return reset_count
+
     def reset_after_date(self, artist_id: str, after_date: str = None) -> int:
         """Reset posts to undone
 
@@ -175,58 +262,61 @@ class Cache:
         Otherwise, reset posts after the specified date.
         """
         with self.lock:
-            posts = self._load_posts(artist_id)
-            if not posts:
-                return 0
+            return self._reset_after_date(artist_id, after_date)
 
-            reset_count = 0
-            for post in posts:
-                # Skip if published is None
-                if not post.published:
-                    continue
+    def reset_after_date_bulk(self, resets: List[Tuple[str, Optional[str]]]) -> Dict[str, int]:
+        """Reset posts to undone for multiple (artist_id, after_date) pairs in one locked pass
 
-                # If no date specified, reset all done posts
-                if not after_date:
-                    if post.done:
-                        post.done = False
-                        post.failed_files = []
-                        reset_count += 1
-                # Otherwise, reset posts after the date
-                elif post.published > after_date and post.done:
-                    post.done = False
-                    post.failed_files = []
-                    reset_count += 1
+        Returns:
+            Number of posts reset per artist ID
+        """
+        with self.lock:
+            return {artist_id: self._reset_after_date(artist_id, after_date) for artist_id, after_date in resets}
 
-            if reset_count > 0:
-                self._save_posts(artist_id, posts)
-                self.logger.cache_reset_after_date(artist_id=artist_id, after_date=after_date or '', count=reset_count)
+    def _deduplicate_posts(self, artist_id: str) -> Tuple[int, int, int]:
+        """Internal: Remove duplicate posts without lock (not thread-safe)"""
+        posts = self._load_posts(artist_id)
+        if not posts:
+            return 0, 0, 0
 
-            return reset_count
+        seen_ids = set()
+        unique_posts = []
+        duplicate_count = 0
 
-    def deduplicate_posts(self, artist_id: str) -> int:
+        for post in posts:
+            if post.id not in seen_ids:
+                seen_ids.add(post.id)
+                unique_posts.append(post)
+            else:
+                duplicate_count += 1
+
+        if duplicate_count > 0:
+            self._save_posts(artist_id, unique_posts)
+            self.logger.cache_deduplicate_posts(artist_id=artist_id, removed=duplicate_count)
+
+        return len(posts), len(unique_posts), duplicate_count
+
+    def deduplicate_posts(self, artist_id: str) -> Tuple[int, int, int]:
         """Remove duplicate posts by ID, keeping the first occurrence
 
         Returns:
-            Number of duplicates removed
+            Tuple of (posts before, posts after, duplicates removed)
         """
         with self.lock:
-            posts = self._load_posts(artist_id)
-            if not posts:
-                return 0
-
-            seen_ids = set()
-            unique_posts = []
-            duplicate_count = 0
+            return self._deduplicate_posts(artist_id)
 
-            for post in posts:
-                if post.id not in seen_ids:
-                    seen_ids.add(post.id)
-                    unique_posts.append(post)
-                else:
-                    duplicate_count += 1
+    def deduplicate_all(self, artist_ids: List[str]) -> Dict[str, int]:
+        """Remove duplicate posts for multiple artists in one locked pass
 
-            if duplicate_count > 0:
-                self._save_posts(artist_id, unique_posts)
-                self.logger.cache_deduplicate_posts(artist_id=artist_id, removed=duplicate_count)
-
-            return duplicate_count
+        Returns:
+            Number of duplicates removed per artist ID, for artists that had any
+        """
+        removed = {}
+        with self.lock:
+            for artist_id in artist_ids:
+                if not self.has_posts(artist_id):
+                    continue
+                duplicate_count = self._deduplicate_posts(artist_id)[2]
+                if duplicate_count > 0:
+                    removed[artist_id] = duplicate_count
+        return removed
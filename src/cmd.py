@@ -1,15 +1,22 @@
+import inspect
 import os
-from collections import defaultdict
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 from prompt_toolkit import prompt
+from prompt_toolkit.shortcuts import clear
 
 from .editor import edit_json
-from .models import Artist, ValidationLevel, ArtistFolderParams, PostFolderParams, MigrationConfig, ExternalLink
+from .models import Artist, Config, ValidationLevel, ArtistFolderParams, PostFolderParams, MigrationConfig, ExternalLink
 from .validator import Validator
 from .formatter import Formatter
 from .storage import Storage
@@ -21,6 +28,23 @@ from .migrator import Migrator
 from .external_links import ExternalLinksExtractor, ExternalLinksDownloader
 
 
+# Answers accepted by confirmation prompts
+_YES_SET = frozenset({'yes', 'YES', 'Yes', 'y', 'Y'})
+
+# Plain YYYY-MM-DDTHH:MM:SS with in-range fields, the format all date prompts produce
+ISO_RE = re.compile(r'^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])T([01]\d|2[0-3]):[0-5]\d:[0-5]\d$')
+
+# Section separators used by command output
+SEP80_EQ = "=" * 80
+SEP80_DASH = "-" * 80
+SEP40_DASH = "-" * 40
+SEP60_EQ = "=" * 60
+
+# Artists updated at once by update-all-basic. Each one may fetch up to 5 post-list
+# pages in parallel (Api.get_all_posts), so at most 10 API requests are in flight.
+_UPDATE_ARTIST_WORKERS = 2
+
+
 # ============================================================================
 # Classes
 # ============================================================================
@@ -42,6 +66,52 @@ class CLIContext:
         self.external_links_downloader = external_links_downloader
         self._last_selected_artist: Optional[str] = None
         self._prefilled_artist_id: Optional[str] = None
+        # Per-thread artists snapshot, since the CLI and RPC threads share this context
+        self._local = threading.local()
+        self._config: Optional[Config] = None
+        self._config_mtime: Optional[int] = None
+
+    def begin_command(self):
+        """Drop the calling thread's artists snapshot before running a new command"""
+        self._local.artists = None
+
+    def artists_snapshot(self) -> List[Artist]:
+        """Artists loaded once per command and thread
+
+        Reloaded when any artist is saved or removed through Storage since it was taken,
+        including saves by the downloader and scheduler.
+        The returned list is shared, copy it before reordering.
+        """
+        revision = self.storage.artists_revision
+        cached = getattr(self._local, 'artists', None)
+        if cached is None or cached[0] != revision:
+            cached = (revision, self.storage.get_artists())
+            self._local.artists = cached
+        return cached[1]
+
+    def save_artist(self, artist: Artist):
+        self.storage.save_artist(artist)
+
+    def remove_artist(self, artist_id: str):
+        self.storage.remove_artist(artist_id)
+
+    @property
+    def config(self) -> Config:
+        """Global config, reloaded only when config.json changes on disk
+
+        The returned object is shared, do not modify it.
+        """
+        mtime = self.storage.config_file.stat().st_mtime_ns
+        if mtime != self._config_mtime:
+            self._config = self.storage.load_config()
+            self._config_mtime = mtime
+        return self._config
+
+    @config.setter
+    def config(self, config: Config):
+        """Replace the cached config after it has been saved"""
+        self._config = config
+        self._config_mtime = self.storage.config_file.stat().st_mtime_ns
 
 
 class ArtistCompleter(Completer):
@@ -51,30 +121,38 @@ class ArtistCompleter(Completer):
         self.ctx = ctx
         self.filter_func = filter_func
         # Build artist list with filtering
-        artists = ctx.storage.get_artists()
+        artists = ctx.artists_snapshot()
         if filter_func:
             artists = [a for a in artists if filter_func(a)]
-        self.artists = artists
 
-        # Build completion options: each artist has one entry with multiple search keys
-        self.completions = []
-        for i, artist in enumerate(self.artists, 1):
-            # Build search keys: number, name, id, alias (if exists)
-            search_keys = [
-                str(i),
-                artist.name.lower(),
-                artist.id.lower()
-            ]
-            if artist.alias:
-                search_keys.append(artist.alias.lower())
+        # Build search keys once: name, id, alias packed into one NUL-separated string
+        self._entries = [
+            ('\0'.join(artist.lowered[:3]), artist)
+            for artist in artists
+        ]
+
+        self._build_completions()
 
+    def narrow_to(self, filter_func):
+        """Narrow completions to matching artists without reloading storage"""
+        self.filter_func = filter_func
+        self._entries = [entry for entry in self._entries if filter_func(entry[1])]
+        self._build_completions()
+
+    def _build_completions(self):
+        """Number artists and build completion options"""
+        self.artists = [artist for _, artist in self._entries]
+
+        # Build completion options: each artist has one entry with all search keys (number first)
+        self.completions = []
+        for i, (search_keys, artist) in enumerate(self._entries, 1):
             # Build display text with all info
             if artist.alias:
                 display = f"{i}. {artist.alias} ({artist.name}) [{artist.id}]"
             else:
                 display = f"{i}. {artist.name} [{artist.id}]"
 
-            self.completions.append((search_keys, display, artist))
+            self.completions.append((f"{i}\0{search_keys}", display, artist))
 
     def get_completions(self, document: Document, complete_event):
         text = document.text_before_cursor.lower()
@@ -90,8 +168,8 @@ class ArtistCompleter(Completer):
             # Fuzzy search - check if text matches any search key
             seen = set()
             for search_keys, display, artist in self.completions:
-                # Check if text is in any of the search keys
-                if any(text in key for key in search_keys):
+                # Single substring scan covers every key, NUL keeps keys from joining
+                if text in search_keys:
                     if display not in seen:
                         seen.add(display)
                         yield Completion(artist.id, start_position=-len(text), display=display)
@@ -101,21 +179,57 @@ class ArtistCompleter(Completer):
 # Helper Functions
 # ============================================================================
 
-def colorize_artist(text: str, artist: Artist, ctx: CLIContext) -> str:
-    """Colorize text based on artist status"""
+def _is_yes(s: str) -> bool:
+    """Check a confirmation answer"""
+    return s.strip() in _YES_SET
+
+
+def _validate_iso(s: str) -> bool:
+    """Check that s is a valid ISO date/time string"""
+    match = ISO_RE.match(s)
+    # Days up to 28 exist in every month; anything else is left to the full parser
+    if match and int(match.group(2)) <= 28:
+        return True
+    try:
+        datetime.fromisoformat(s)
+        return True
+    except ValueError:
+        return False
+
+
+def _fmt_elapsed(seconds: int) -> str:
+    """Format elapsed seconds as "42s", "3m 5s" or "2h 10m"."""
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
+
+
+def colorize_artist(text: str, artist: Artist, stats: dict) -> str:
+    """Colorize text based on artist status and cache stats"""
     if artist.completed:
         return f"\033[92m{text}\033[0m"  # Green
     elif artist.ignore:
         return f"\033[90m{text}\033[0m"  # Gray
-    stats = ctx.cache.stats(artist.id)
     if stats['total'] == 0 or stats['pending'] > 0 or stats['failed'] > 0:
         return f"\033[91m{text}\033[0m"  # Red
     return text
 
 
-def get_artists(ctx: CLIContext, filter_func=None, sort_by='name', service="") -> list[Artist]:
-    """Get filtered and sorted artists"""
-    artists = ctx.storage.get_artists()
+def has_undone_work(stats: dict) -> bool:
+    """Whether cache stats show undone posts, or no cache yet"""
+    return stats['total'] == 0 or stats['undone'] > 0
+
+
+def get_artists(ctx: CLIContext, filter_func=None, sort_by='name', service="", stats_map: Optional[dict] = None) -> list[Artist]:
+    """Get filtered and sorted artists
+
+    If stats_map is given, cache stats loaded for sorting are stored in it by artist id.
+    """
+    artists = list(ctx.artists_snapshot())
 
     if filter_func:
         artists = [a for a in artists if filter_func(a)]
@@ -123,14 +237,19 @@ def get_artists(ctx: CLIContext, filter_func=None, sort_by='name', service="") -
         artists = [a for a in artists if a.service.lower() == service.lower()]
 
     if sort_by == 'name':
-        artists.sort(key=lambda a: a.display_name().lower())
+        artists.sort(key=lambda a: a.lowered[3])
     elif sort_by == 'status':
         def status_key(a):
             priority = 2 if a.completed else 1 if a.ignore else 0
-            return (priority, a.display_name().lower())
+            return (priority, a.lowered[3])
         artists.sort(key=status_key)
     elif sort_by == 'posts':
-        artists.sort(key=lambda a: ctx.cache.stats(a.id)['total'], reverse=True)
+        if stats_map is None:
+            stats_map = {}
+        for a in artists:
+            if a.id not in stats_map:
+                stats_map[a.id] = ctx.cache.stats(a.id)
+        artists.sort(key=lambda a: stats_map[a.id]['total'], reverse=True)
     elif sort_by == 'recent':
         artists.sort(key=lambda a: a.last_date or '', reverse=True)
     elif sort_by == 'service':
@@ -141,15 +260,16 @@ def get_artists(ctx: CLIContext, filter_func=None, sort_by='name', service="") -
 
 def display_artist_list(ctx: CLIContext, filter_func=None, sort_by='name', service="", numbered: bool = False) -> list[Artist]:
     """Display artist list"""
-    artists = get_artists(ctx, filter_func, sort_by, service)
+    stats_map = {}
+    artists = get_artists(ctx, filter_func, sort_by, service, stats_map)
 
     print("\nArtists:")
-    print("-" * 80)
+    print(SEP80_DASH)
     for i, artist in enumerate(artists, 1):
         status = "DONE" if artist.completed else "IGNORE" if artist.ignore else "Active"
         service = artist.service.capitalize() if artist.service else "Unkown"
         last = artist.last_date or "All posts"
-        stats = ctx.cache.stats(artist.id)
+        stats = stats_map.get(artist.id) or ctx.cache.stats(artist.id)
         cache_info = f"{stats['done']}/{stats['total']} done" if stats['total'] > 0 else "No cache"
 
         if numbered:
@@ -157,8 +277,8 @@ def display_artist_list(ctx: CLIContext, filter_func=None, sort_by='name', servi
         else:
             line = f"[{status:6}] [{service:^7}] {last:19} {cache_info:15} - {artist.display_name()}"
 
-        print(colorize_artist(line, artist, ctx))
-    print("-" * 80)
+        print(colorize_artist(line, artist, stats))
+    print(SEP80_DASH)
 
     return artists
 
@@ -178,15 +298,15 @@ def find_artist(user_input: str, ctx: CLIContext, filter_func=None) -> tuple[Opt
     # Try exact ID
     user_lower = user_input.lower()
     for artist in artists:
-        if user_lower == artist.id.lower():
+        if user_lower == artist.lowered[0]:
             return (artist, None)
 
     # Fuzzy search
     matches = [
         a for a in artists
-        if user_lower in a.id.lower() or
-           user_lower in a.display_name().lower() or
-           (a.alias and user_lower in a.alias.lower())
+        if user_lower in a.lowered[0] or
+           user_lower in a.lowered[3] or
+           (a.alias and user_lower in a.lowered[2])
     ]
 
     if not matches:
@@ -204,28 +324,30 @@ def find_artist(user_input: str, ctx: CLIContext, filter_func=None) -> tuple[Opt
 def prompt_selection(ctx: CLIContext, filter_func=None) -> Optional[Artist]:
     """Prompt user to select an artist"""
     try:
-        user_input = prompt("> ", completer=ArtistCompleter(ctx, filter_func)).strip()
-        if not user_input:
-            print("No input provided")
-            return None
+        completer = ArtistCompleter(ctx, filter_func)
+        while True:
+            user_input = prompt("> ", completer=completer).strip()
+            if not user_input:
+                print("No input provided")
+                return None
 
-        exact, new_filter = find_artist(user_input, ctx, filter_func)
+            exact, new_filter = find_artist(user_input, ctx, filter_func)
 
-        if exact:
-            print(f"Selected: {exact.display_name()}")
-            # Record the artist selection for history
-            ctx._last_selected_artist = exact.id
-            return exact
+            if exact:
+                print(f"Selected: {exact.display_name()}")
+                # Record the artist selection for history
+                ctx._last_selected_artist = exact.id
+                return exact
 
-        if new_filter is None:
-            print(f"No artist found matching '{user_input}'")
-            return None
+            if new_filter is None:
+                print(f"No artist found matching '{user_input}'")
+                return None
 
-        # Multiple matches - display and recurse
-        match_count = len(get_artists(ctx, new_filter))
-        print(f"\nFound {match_count} matches:")
-        display_artist_list(ctx, new_filter, numbered=True)
-        return prompt_selection(ctx, new_filter)
+            # Multiple matches - narrow down and prompt again
+            filter_func = new_filter
+            completer.narrow_to(new_filter)
+            print(f"\nFound {len(completer.artists)} matches:")
+            display_artist_list(ctx, new_filter, numbered=True)
 
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled")
@@ -354,20 +476,24 @@ def cmd_help(ctx: CLIContext = None):
 def cmd_add_artist(ctx: CLIContext):
     """Add artist"""
     print("\nAdd Artist")
-    print("-" * 40)
+    print(SEP40_DASH)
 
     url = input("Artist URL: ").strip()
     if not url:
         print("URL required")
         return
 
-    parts = url.rstrip('/').split('/')
-    if len(parts) < 5:
+    # .../<service>/user/<user_id>: slice from the right instead of splitting the whole URL
+    path = url.rstrip('/')
+    if path.count('/') < 4:
         print("Invalid URL format")
         return
 
-    service = parts[-3]
-    user_id = parts[-1]
+    i1 = path.rfind('/')
+    i2 = path.rfind('/', 0, i1)
+    i3 = path.rfind('/', 0, i2)
+    service = path[i3 + 1:i2]
+    user_id = path[i1 + 1:]
 
     # Try to fetch artist name from profile
     name = None
@@ -390,12 +516,9 @@ def cmd_add_artist(ctx: CLIContext):
     print("Leave empty to download all posts")
     last_date = input("Last date: ").strip()
 
-    if last_date:
-        try:
-            datetime.fromisoformat(last_date)
-        except ValueError:
-            print("Invalid date format")
-            return
+    if last_date and not _validate_iso(last_date):
+        print("Invalid date format")
+        return
 
     artist_id = f"{service}_{user_id}"
 
@@ -413,7 +536,7 @@ def cmd_add_artist(ctx: CLIContext):
         last_date=last_date or None
     )
 
-    ctx.storage.save_artist(artist)
+    ctx.save_artist(artist)
 
     print(f"Added: {artist.display_name()}")
     if last_date:
@@ -426,11 +549,11 @@ def cmd_remove_artist(ctx: CLIContext):
     if not artist:
         return
 
-    confirm = input(f"\nAre you sure you want to remove {artist.display_name()}? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input(f"\nAre you sure you want to remove {artist.display_name()}? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
-    ctx.storage.remove_artist(artist.id)
+    ctx.remove_artist(artist.id)
 
     print(f"Removed: {artist.display_name()}")
 
@@ -462,7 +585,7 @@ def cmd_ignore_artist(ctx: CLIContext):
         return
 
     artist.ignore = True
-    ctx.storage.save_artist(artist)
+    ctx.save_artist(artist)
     print(f"Set ignore flag for: {artist.display_name()}")
     print("This artist will be skipped by scheduled tasks")
 
@@ -474,13 +597,13 @@ def cmd_unignore_artist(ctx: CLIContext):
         return
 
     artist.ignore = False
-    ctx.storage.save_artist(artist)
+    ctx.save_artist(artist)
     print(f"Removed ignore flag for: {artist.display_name()}")
     print("This artist will be included in scheduled tasks")
 
 def cmd_unignore_all(ctx: CLIContext):
     """Unignore all artists"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     ignored_artists = [a for a in artists if a.ignore]
 
     if not ignored_artists:
@@ -489,7 +612,7 @@ def cmd_unignore_all(ctx: CLIContext):
 
     for artist in ignored_artists:
         artist.ignore = False
-        ctx.storage.save_artist(artist)
+        ctx.save_artist(artist)
         print(f"Removed ignore flag for: {artist.display_name()}")
 
     print(f"\nTotal unignored: {len(ignored_artists)} artists")
@@ -502,7 +625,7 @@ def cmd_complete_artist(ctx: CLIContext):
         return
 
     artist.completed = True
-    ctx.storage.save_artist(artist)
+    ctx.save_artist(artist)
     print(f"Marked as completed: {artist.display_name()}")
     print("This artist will be skipped in all downloads (manual and scheduled)")
 
@@ -514,13 +637,13 @@ def cmd_uncomplete_artist(ctx: CLIContext):
         return
 
     artist.completed = False
-    ctx.storage.save_artist(artist)
+    ctx.save_artist(artist)
     print(f"Removed completed flag for: {artist.display_name()}")
     print("This artist will be included in downloads")
 
 def cmd_uncomplete_all(ctx: CLIContext):
     """Unmark all completed artists"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     completed_artists = [a for a in artists if a.completed]
 
     if not completed_artists:
@@ -529,7 +652,7 @@ def cmd_uncomplete_all(ctx: CLIContext):
 
     for artist in completed_artists:
         artist.completed = False
-        ctx.storage.save_artist(artist)
+        ctx.save_artist(artist)
         print(f"Removed completed flag for: {artist.display_name()}")
 
     print(f"\nTotal uncompleted: {len(completed_artists)} artists")
@@ -567,7 +690,7 @@ def cmd_ignore_inactive(ctx: CLIContext, months: str = "6"):
 
     threshold = subtract_months(datetime.now(), months_int)
 
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
@@ -584,7 +707,7 @@ def cmd_ignore_inactive(ctx: CLIContext, months: str = "6"):
             continue
 
         # Must have no undone posts (includes posts with failed files)
-        if len(ctx.cache.get_undone(artist.id)) > 0:
+        if stats['undone'] > 0:
             continue
 
         # Find last published date from cached posts
@@ -627,7 +750,7 @@ def cmd_ignore_inactive(ctx: CLIContext, months: str = "6"):
     updated = 0
     for artist, last_dt in sorted(candidates, key=lambda x: x[1]):
         artist.ignore = True
-        ctx.storage.save_artist(artist)
+        ctx.save_artist(artist)
         updated += 1
         print(f"Ignored: {artist.display_name()} [{artist.id}] (last post: {last_dt.date()})")
 
@@ -647,24 +770,26 @@ def cmd_check_artist(ctx: CLIContext):
 
 
 def cmd_check_all_artists(ctx: CLIContext):
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
-    active_artists = [a for a in artists if not a.ignore and not a.completed]
-    if not active_artists:
+    tasks = [(a.id, None, None) for a in artists if not a.ignore and not a.completed]
+    if not tasks:
         print("No active artists to check")
         return
 
-    added = ctx.scheduler.queue_batch([a.id for a in active_artists])
+    added = ctx.scheduler.queue_batch_with_ranges(tasks)
     print(f"\nQueued {added} artists for download")
     print("Use 'tasks' to view queue status")
 
 
 def cmd_check_undone(ctx: CLIContext):
     """Check artist with undone posts"""
-    artist = select_artist(ctx, filter_func=lambda a: (len(ctx.cache.get_undone(a.id)) > 0 or ctx.cache.stats(a.id)['total'] == 0) and not a.completed and not a.ignore)
+    # The filter runs for listing, completion and matching; load each artist's cache once
+    get_stats = lru_cache(maxsize=None)(ctx.cache.stats)
+    artist = select_artist(ctx, filter_func=lambda a: not a.completed and not a.ignore and has_undone_work(get_stats(a.id)))
     if not artist:
         return
 
@@ -679,19 +804,21 @@ def cmd_check_undone(ctx: CLIContext):
 
 def cmd_check_all_undone(ctx: CLIContext):
     """Check all artists with undone posts"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
-    active_artists = [a for a in artists if not a.ignore and not a.completed]
-    artists_with_undone = [a for a in active_artists if len(ctx.cache.get_undone(a.id)) > 0 or ctx.cache.stats(a.id)['total'] == 0]
+    tasks = [
+        (a.id, None, None) for a in artists
+        if not a.ignore and not a.completed and has_undone_work(ctx.cache.stats(a.id))
+    ]
 
-    if not artists_with_undone:
+    if not tasks:
         print("No active artists with undone posts to check")
         return
 
-    added = ctx.scheduler.queue_batch([a.id for a in artists_with_undone])
+    added = ctx.scheduler.queue_batch_with_ranges(tasks)
     print(f"\nQueued {added} artists with undone posts for download")
     print("Use 'tasks' to view queue status")
 
@@ -712,12 +839,10 @@ def cmd_check_from_date(ctx: CLIContext):
     if date_input:
         if 'T' not in date_input:
             date_input = f"{date_input}T00:00:00"
-        try:
-            datetime.fromisoformat(date_input)
-            from_date = date_input
-        except ValueError:
+        if not _validate_iso(date_input):
             print("Invalid date format")
             return
+        from_date = date_input
     else:
         from_date = ""
 
@@ -742,12 +867,10 @@ def cmd_check_until_date(ctx: CLIContext):
     if 'T' not in date_input:
         date_input = f"{date_input}T23:59:59"
 
-    try:
-        datetime.fromisoformat(date_input)
-        until_date = date_input
-    except ValueError:
+    if not _validate_iso(date_input):
         print("Invalid date format")
         return
+    until_date = date_input
 
     print(f"Queued: {artist.display_name()} until {until_date}")
     ctx.scheduler.queue_manual(artist.id, None, until_date)
@@ -769,12 +892,10 @@ def cmd_check_date_range(ctx: CLIContext):
     if from_input:
         if 'T' not in from_input:
             from_input = f"{from_input}T00:00:00"
-        try:
-            datetime.fromisoformat(from_input)
-            from_date = from_input
-        except ValueError:
+        if not _validate_iso(from_input):
             print("Invalid date format")
             return
+        from_date = from_input
     else:
         from_date = ""
 
@@ -787,12 +908,10 @@ def cmd_check_date_range(ctx: CLIContext):
     if 'T' not in until_input:
         until_input = f"{until_input}T23:59:59"
 
-    try:
-        datetime.fromisoformat(until_input)
-        until_date = until_input
-    except ValueError:
+    if not _validate_iso(until_input):
         print("Invalid date format")
         return
+    until_date = until_input
 
     if from_date and from_date >= until_date:
         print("Starting date must be before ending date")
@@ -825,7 +944,7 @@ def cmd_update_cache_basic(ctx: CLIContext):
 
 def cmd_update_all_basic(ctx: CLIContext):
     """Update all basic cache"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
@@ -841,21 +960,28 @@ def cmd_update_all_basic(ctx: CLIContext):
     success_count = 0
     failed_count = 0
 
-    for artist in active_artists:
-        try:
-            updated = ctx.downloader.update_posts_basic(artist)
-            if updated:
-                success_count += 1
-                print(f"✓ {artist.display_name()}")
-            else:
-                print(f"- {artist.display_name()} (no new posts)")
-        except Exception as e:
-            failed_count += 1
-            print(f"✗ {artist.display_name()}: {e}")
+    # Artists are independent network-bound updates; report them as they finish.
+    # Most only need a profile request; the small fixed pool bounds the API load.
+    executor = ThreadPoolExecutor(max_workers=_UPDATE_ARTIST_WORKERS)
+    try:
+        futures = {executor.submit(ctx.downloader.update_posts_basic, artist): artist for artist in active_artists}
+        for future in as_completed(futures):
+            artist = futures[future]
+            try:
+                updated = future.result()
+                if updated:
+                    success_count += 1
+                    print(f"✓ {artist.display_name()}")
+                else:
+                    print(f"- {artist.display_name()} (no new posts)")
+            except Exception as e:
+                failed_count += 1
+                print(f"✗ {artist.display_name()}: {e}")
+    finally:
+        # Drop queued artists, but do not return while running workers still write caches
+        executor.shutdown(wait=True, cancel_futures=True)
 
-    print(f"\n{'='*60}")
-    print(f"Completed: {success_count} successful, {failed_count} failed")
-    print(f"{'='*60}\n")
+    print(f"\n{SEP60_EQ}\nCompleted: {success_count} successful, {failed_count} failed\n{SEP60_EQ}\n")
 
 
 def cmd_update_cache_full(ctx: CLIContext):
@@ -867,8 +993,8 @@ def cmd_update_cache_full(ctx: CLIContext):
     print(f"\nUpdating full post info for: {artist.display_name()}")
     print("This will fetch complete data for all posts (may take a while)...")
 
-    confirm = input("Continue? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input("Continue? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
@@ -881,7 +1007,7 @@ def cmd_update_cache_full(ctx: CLIContext):
 
 def cmd_update_all_full(ctx: CLIContext):
     """Update all full cache"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
@@ -894,8 +1020,8 @@ def cmd_update_all_full(ctx: CLIContext):
     print(f"\nUpdating full post info for {len(active_artists)} artists...")
     print("This will fetch complete data for all posts (may take a very long time)...")
 
-    confirm = input("Continue? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input("Continue? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
@@ -903,6 +1029,8 @@ def cmd_update_all_full(ctx: CLIContext):
     failed_count = 0
     total_updated = 0
 
+    # One artist at a time: update_posts_full already fetches max_concurrent_posts posts
+    # in parallel, and running artists concurrently would multiply that against the API
     for artist in active_artists:
         try:
             updated_count = ctx.downloader.update_posts_full(artist)
@@ -916,10 +1044,10 @@ def cmd_update_all_full(ctx: CLIContext):
             failed_count += 1
             print(f"✗ {artist.display_name()}: {e}")
 
-    print(f"\n{'='*60}")
+    print(f"\n{SEP60_EQ}")
     print(f"Completed: {success_count} successful, {failed_count} failed")
     print(f"Total posts updated: {total_updated}")
-    print(f"{'='*60}\n")
+    print(f"{SEP60_EQ}\n")
 
 
 def cmd_reset_artist(ctx: CLIContext, last_date: str = ""):
@@ -929,14 +1057,14 @@ def cmd_reset_artist(ctx: CLIContext, last_date: str = ""):
         return
 
     print(f"\n{artist.display_name()} - Reset Posts")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     last_date = None if last_date.lower() == "none" else (last_date or artist.last_date)
 
     if not last_date:
         print("No last_date set - will reset ALL posts to undone")
-        confirm = input("Continue? (yes/no): ").strip().lower()
-        if confirm != "yes":
+        confirm = input("Continue? (yes/no): ")
+        if not _is_yes(confirm):
             print("Cancelled")
             return
         count = ctx.cache.reset_after_date(artist.id, None)
@@ -944,8 +1072,8 @@ def cmd_reset_artist(ctx: CLIContext, last_date: str = ""):
     else:
         print(f"Current last_date: {last_date}")
         print(f"Will reset posts AFTER {last_date} to undone")
-        confirm = input("Continue? (yes/no): ").strip().lower()
-        if confirm != "yes":
+        confirm = input("Continue? (yes/no): ")
+        if not _is_yes(confirm):
             print("Cancelled")
             return
         count = ctx.cache.reset_after_date(artist.id, last_date)
@@ -954,7 +1082,7 @@ def cmd_reset_artist(ctx: CLIContext, last_date: str = ""):
 
 def cmd_reset_all_artists(ctx: CLIContext):
     """Reset all posts"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
@@ -963,30 +1091,26 @@ def cmd_reset_all_artists(ctx: CLIContext):
     artists_without_date = [a for a in artists if not a.last_date]
 
     print(f"\nReset Posts for All Artists")
-    print("-" * 80)
+    print(SEP80_DASH)
     if artists_with_date:
         print(f"  With last_date: {len(artists_with_date)} (reset posts after last_date)")
     if artists_without_date:
         print(f"  Without last_date: {len(artists_without_date)} (reset ALL posts)")
 
-    confirm = input("\nContinue? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input("\nContinue? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
-    total_reset = 0
-    for artist in artists_with_date:
-        count = ctx.cache.reset_after_date(artist.id, artist.last_date)
-        if count > 0:
+    ordered = artists_with_date + artists_without_date
+    counts = ctx.cache.reset_after_date_bulk([(a.id, a.last_date or None) for a in ordered])
 
-            print(f"{artist.display_name()}: {count} posts")
-            total_reset += count
-
-    for artist in artists_without_date:
-        count = ctx.cache.reset_after_date(artist.id, None)
+    total_reset = 0
+    for artist in ordered:
+        count = counts[artist.id]
         if count > 0:
-
-            print(f"{artist.display_name()}: {count} posts (all)")
+            suffix = "" if artist.last_date else " (all)"
+            print(f"{artist.display_name()}: {count} posts{suffix}")
             total_reset += count
 
     print(f"\nTotal: {total_reset} posts reset")
@@ -1003,7 +1127,7 @@ def cmd_clean_post_folders(ctx: CLIContext, quarantine_name: str = "Invalid", dr
     if not artist:
         return
 
-    config = ctx.storage.load_config()
+    config = ctx.config
 
     # Resolve artist directory using current templates
     artist_params = ArtistFolderParams(
@@ -1045,7 +1169,7 @@ def cmd_clean_post_folders(ctx: CLIContext, quarantine_name: str = "Invalid", dr
     invalid = [p for p in candidates if p.name not in expected]
 
     print(f"\n{artist.display_name()} - Clean Post Folders")
-    print("-" * 80)
+    print(SEP80_DASH)
     print(f"Artist dir: {artist_dir}")
     print(f"Quarantine: {artist_dir / quarantine_name}")
     print(f"Expected post folders: {len(expected)}")
@@ -1097,12 +1221,12 @@ def cmd_clean_all_post_folders(ctx: CLIContext, quarantine_name: str = "Invalid"
     - quarantine_name: name of the quarantine folder under each artist directory (default: Invalid)
     - dry: 'true' or 'false' (default: 'false')
     """
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
-    config = ctx.storage.load_config()
+    config = ctx.config
     dry_mode = str(dry).strip().lower() == 'true'
 
     import shutil
@@ -1112,7 +1236,7 @@ def cmd_clean_all_post_folders(ctx: CLIContext, quarantine_name: str = "Invalid"
     processed = 0
 
     print(f"\nClean Post Folders for All Artists")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     for artist in artists:
         # Resolve artist dir
@@ -1189,7 +1313,7 @@ def cmd_clean_all_post_folders(ctx: CLIContext, quarantine_name: str = "Invalid"
 
         processed += 1
 
-    print("-" * 80)
+    print(SEP80_DASH)
     print(f"Artists processed: {processed}")
     print(f"Invalid folders found: {total_invalid}")
     if dry_mode:
@@ -1216,10 +1340,10 @@ def cmd_reset_conflicts(ctx: CLIContext):
         print("Run 'update-cache-basic' or 'update-cache-full' first to fetch posts")
         return
 
-    config = ctx.storage.load_config()
+    config = ctx.config
 
     print(f"\n{artist.display_name()} - Reset by Conflicts")
-    print("-" * 80)
+    print(SEP80_DASH)
     print("\nValidation level:")
     print("1. Artist folder only")
     print("2. Artist + Post folders")
@@ -1238,7 +1362,7 @@ def cmd_reset_conflicts(ctx: CLIContext):
         print("No files found in posts")
         return
 
-    conflicts, filtered_count = ctx.validator.validate_full_paths(validation_data, level)
+    conflicts, filtered_count = ctx.validator.validate_full_paths(validation_data, level).as_tuple()
     if filtered_count > 0:
         print(f"Filtered {filtered_count} ignored conflicts")
 
@@ -1251,24 +1375,15 @@ def cmd_reset_conflicts(ctx: CLIContext):
     reset_posts = set()               # (artist_id, post_id)
 
     if level_input == "1":
-        # Artist-level: ids are artist_ids
-        for _, ids in conflicts:
-            for aid in ids:
-                reset_all_artists.add(aid)
-    elif level_input == "2":
-        # Post-level: ids like "artistId:postId"
+        # Artist-level: ids are (artist_id,)
         for _, ids in conflicts:
-            for id_str in ids:
-                parts = id_str.split(":", 1)
-                if len(parts) == 2:
-                    reset_posts.add((parts[0], parts[1]))
+            for item_id in ids:
+                reset_all_artists.add(item_id[0])
     else:
-        # File-level: ids like "artistId:postId:fileName"
+        # Post-level ids are (artist_id, post_id), file-level add the file name
         for _, ids in conflicts:
-            for id_str in ids:
-                parts = id_str.split(":", 2)
-                if len(parts) >= 2:
-                    reset_posts.add((parts[0], parts[1]))
+            for item_id in ids:
+                reset_posts.add(item_id[:2])
 
     # If artist-level selected, resetting all posts supersedes per-post resets
     if reset_all_artists:
@@ -1278,8 +1393,8 @@ def cmd_reset_conflicts(ctx: CLIContext):
     print(f"  Artists (all posts): {len(reset_all_artists)}")
     print(f"  Individual posts:   {len(reset_posts)}")
 
-    confirm = input("Proceed with reset? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input("Proceed with reset? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
@@ -1292,7 +1407,7 @@ def cmd_reset_conflicts(ctx: CLIContext):
             total_posts_reset += count
             # Try to log with name if available
             try:
-                a_obj = next((a for a in ctx.storage.get_artists() if a.id == aid), None)
+                a_obj = next((a for a in ctx.artists_snapshot() if a.id == aid), None)
                 name = a_obj.display_name() if a_obj else aid
             except Exception:
                 name = aid
@@ -1314,15 +1429,15 @@ def cmd_reset_all_conflicts(ctx: CLIContext):
     2. Post-level conflicts   -> reset ONLY conflicting posts
     3. File-level conflicts   -> reset posts containing conflicting files
     """
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
-    config = ctx.storage.load_config()
+    config = ctx.config
 
     print(f"\nReset by Conflicts for All Artists")
-    print("-" * 80)
+    print(SEP80_DASH)
     print("\nValidation level:")
     print("1. Artist folder only")
     print("2. Artist + Post folders")
@@ -1350,7 +1465,7 @@ def cmd_reset_all_conflicts(ctx: CLIContext):
         return
 
     validation_data = Validator.build_validation_data(artists_with_posts, config)
-    conflicts, filtered_count = ctx.validator.validate_full_paths(validation_data, level)
+    conflicts, filtered_count = ctx.validator.validate_full_paths(validation_data, level).as_tuple()
     if filtered_count > 0:
         print(f"Filtered {filtered_count} ignored conflicts")
 
@@ -1363,20 +1478,12 @@ def cmd_reset_all_conflicts(ctx: CLIContext):
 
     if level_input == "1":
         for _, ids in conflicts:
-            for aid in ids:
-                reset_all_artists.add(aid)
-    elif level_input == "2":
-        for _, ids in conflicts:
-            for id_str in ids:
-                parts = id_str.split(":", 1)
-                if len(parts) == 2:
-                    reset_posts.add((parts[0], parts[1]))
+            for item_id in ids:
+                reset_all_artists.add(item_id[0])
     else:
         for _, ids in conflicts:
-            for id_str in ids:
-                parts = id_str.split(":", 2)
-                if len(parts) >= 2:
-                    reset_posts.add((parts[0], parts[1]))
+            for item_id in ids:
+                reset_posts.add(item_id[:2])
 
     if reset_all_artists:
         reset_posts = {ap for ap in reset_posts if ap[0] not in reset_all_artists}
@@ -1385,8 +1492,8 @@ def cmd_reset_all_conflicts(ctx: CLIContext):
     print(f"  Artists (all posts): {len(reset_all_artists)}")
     print(f"  Individual posts:   {len(reset_posts)}")
 
-    confirm = input("Proceed with reset? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input("Proceed with reset? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
@@ -1412,7 +1519,9 @@ def cmd_reset_all_conflicts(ctx: CLIContext):
 
 def cmd_list_undone(ctx: CLIContext):
     """List undone posts"""
-    artist = select_artist(ctx, filter_func=lambda a: len(ctx.cache.get_undone(a.id)) > 0 or ctx.cache.stats(a.id)['total'] == 0)
+    # The filter runs for listing, completion and matching; load each artist's cache once
+    get_stats = lru_cache(maxsize=None)(ctx.cache.stats)
+    artist = select_artist(ctx, filter_func=lambda a: has_undone_work(get_stats(a.id)))
     if not artist:
         return
 
@@ -1421,57 +1530,48 @@ def cmd_list_undone(ctx: CLIContext):
         print(f"\n{artist.display_name()}: No undone posts")
         return
 
-    print(f"\n{artist.display_name()} - Undone Posts ({len(undone_posts)}):")
-    print("-" * 80)
-
-    for post in undone_posts:
-        status = "Not done" if not post.done else f"Failed ({len(post.failed_files)} files)"
-        print(f"\nPost ID: {post.id}")
-        print(f"Title: {post.title}")
-        print(f"Published: {post.published}")
-        print(f"Status: {status}")
-        if post.failed_files:
-            print(f"Failed files:")
-            for file in post.failed_files:
-                print(f"  - {file}")
-    print()
+    lines = [f"\n{artist.display_name()} - Undone Posts ({len(undone_posts)}):", SEP80_DASH]
+    # One string per post, failed file list included
+    lines += [
+        f"\nPost ID: {post.id}\nTitle: {post.title}\nPublished: {post.published}\n"
+        f"Status: {'Not done' if not post.done else f'Failed ({len(post.failed_files)} files)'}"
+        + ("\nFailed files:\n" + "\n".join(f"  - {file}" for file in post.failed_files) if post.failed_files else "")
+        for post in undone_posts
+    ]
+    lines.append("")
+    print("\n".join(lines))
 
 
 def cmd_list_all_undone(ctx: CLIContext):
     """List all undone posts"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
-    total_undone = 0
-    artists_with_undone = []
-
-    for artist in artists:
-        undone_posts = ctx.cache.get_undone(artist.id)
-        if undone_posts:
-            artists_with_undone.append((artist, undone_posts))
-            total_undone += len(undone_posts)
+    undone = ctx.cache.get_undone_bulk([a.id for a in artists])
+    artists_with_undone = [(a, undone[a.id]) for a in artists if a.id in undone]
+    total_undone = sum(map(len, undone.values()))
 
     if not artists_with_undone:
         print("\nNo undone posts found")
         return
 
-    print(f"Undone Posts Summary ({total_undone} posts across {len(artists_with_undone)} artists):")
-    print("=" * 80)
+    lines = [f"Undone Posts Summary ({total_undone} posts across {len(artists_with_undone)} artists):", SEP80_EQ]
 
     for artist, undone_posts in artists_with_undone:
-        print(f"\n{artist.display_name()} - {len(undone_posts)} undone posts:")
-        print("-" * 80)
+        lines.append(f"\n{artist.display_name()} - {len(undone_posts)} undone posts:")
+        lines.append(SEP80_DASH)
 
         for post in undone_posts:
             status = "Not done" if not post.done else f"Failed ({len(post.failed_files)} files)"
-            print(f"  [{post.published[:10]}] {post.title[:50]} - {status}")
+            lines.append(f"  [{post.published[:10]}] {post.title[:50]} - {status}")
             if post.failed_files and len(post.failed_files) <= 3:
-                print(f"    Failed files: {', '.join(post.failed_files)}")
+                lines.append(f"    Failed files: {', '.join(post.failed_files)}")
             elif post.failed_files:
-                print(f"    Failed files: {', '.join(post.failed_files[:3])} ... and {len(post.failed_files) - 3} more")
-    print()
+                lines.append(f"    Failed files: {', '.join(post.failed_files[:3])} ... and {len(post.failed_files) - 3} more")
+    lines.append("")
+    print("\n".join(lines))
 
 
 def cmd_dedupe_artist(ctx: CLIContext):
@@ -1480,23 +1580,20 @@ def cmd_dedupe_artist(ctx: CLIContext):
     if not artist:
         return
 
-    posts = ctx.cache.load_posts(artist.id)
-    if not posts:
+    before, after, duplicate_count = ctx.cache.deduplicate_posts(artist.id)
+    if before == 0:
         print(f"\n{artist.display_name()}: No cached posts found")
         return
 
     print(f"\n{artist.display_name()} - Removing duplicate posts...")
-    print("-" * 80)
-    print(f"Total posts before: {len(posts)}")
-
-    duplicate_count = ctx.cache.deduplicate_posts(artist.id)
+    print(SEP80_DASH)
+    print(f"Total posts before: {before}")
 
     if duplicate_count == 0:
         print("✓ No duplicate posts found")
     else:
-        posts_after = ctx.cache.load_posts(artist.id)
         print(f"✗ Found and removed {duplicate_count} duplicate posts")
-        print(f"Total posts after: {len(posts_after)}")
+        print(f"Total posts after: {after}")
 
 
     print()
@@ -1504,38 +1601,29 @@ def cmd_dedupe_artist(ctx: CLIContext):
 
 def cmd_dedupe_all_artists(ctx: CLIContext):
     """Remove duplicate posts for all artists"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
     print(f"\nRemoving duplicate posts for {len(artists)} artists...")
-    print("=" * 80)
-
-    total_duplicates = 0
-    artists_with_duplicates = []
-
-    for artist in artists:
-        posts = ctx.cache.load_posts(artist.id)
-        if not posts:
-            continue
+    print(SEP80_EQ)
 
-        duplicate_count = ctx.cache.deduplicate_posts(artist.id)
-        if duplicate_count > 0:
-            artists_with_duplicates.append((artist, duplicate_count))
-            total_duplicates += duplicate_count
+    removed = ctx.cache.deduplicate_all([a.id for a in artists])
+    artists_with_duplicates = [(a, removed[a.id]) for a in artists if a.id in removed]
+    total_duplicates = sum(removed.values())
 
     if not artists_with_duplicates:
         print("\n✓ No duplicate posts found")
     else:
         print(f"\n✗ Found and removed duplicates from {len(artists_with_duplicates)} artists:")
-        print("-" * 80)
+        print(SEP80_DASH)
 
         for artist, duplicate_count in artists_with_duplicates:
             print(f"  {artist.display_name()}: {duplicate_count} duplicates removed")
 
 
-        print(f"\n{'='*80}")
+        print(f"\n{SEP80_EQ}")
         print(f"Total duplicates removed: {total_duplicates}")
 
     print()
@@ -1549,56 +1637,51 @@ def cmd_tasks(ctx: CLIContext):
     status = ctx.scheduler.get_queue_status()
     active_tasks = ctx.scheduler.list_active_tasks()
     queued_tasks = ctx.scheduler.list_queued_tasks()
-
-    print("\n" + "=" * 80)
-    print("TASK QUEUE STATUS")
-    print("=" * 80)
-    print(f"  Queued:    {status.queued:>3}")
-    print(f"  Running:   {status.running:>3}")
-    print(f"  Completed: {status.completed:>3}")
-    print()
+    name_by_id = {a.id: a.display_name() for a in ctx.artists_snapshot()} if active_tasks or queued_tasks else {}
+
+    lines = [
+        "\n" + SEP80_EQ,
+        "TASK QUEUE STATUS",
+        SEP80_EQ,
+        f"  Queued:    {status.queued:>3}",
+        f"  Running:   {status.running:>3}",
+        f"  Completed: {status.completed:>3}",
+        "",
+    ]
 
     if active_tasks:
-        print("-" * 80)
-        print(f"RUNNING TASKS ({len(active_tasks)})")
-        print("-" * 80)
-        print(f"{'Type':<10} {'Status':<10} {'Elapsed':<10} {'Posts':<9} Artist")
-        print("-" * 80)
+        lines.append(SEP80_DASH)
+        lines.append(f"RUNNING TASKS ({len(active_tasks)})")
+        lines.append(SEP80_DASH)
+        lines.append(f"{'Type':<10} {'Status':<10} {'Elapsed':<10} {'Posts':<9} Artist")
+        lines.append(SEP80_DASH)
+        now = datetime.now()
         for task in active_tasks:
-            elapsed = ""
-            if task.started_at:
-                seconds = (datetime.now() - task.started_at).seconds
-                if seconds < 60:
-                    elapsed = f"{seconds}s"
-                elif seconds < 3600:
-                    elapsed = f"{seconds // 60}m {seconds % 60}s"
-                else:
-                    elapsed = f"{seconds // 3600}h {(seconds % 3600) // 60}m"
+            elapsed = _fmt_elapsed((now - task.started_at).seconds) if task.started_at else ""
 
-            artist = ctx.storage.get_artist(task.artist_id)
-            name = artist.display_name() if artist else task.artist_id
+            name = name_by_id.get(task.artist_id, task.artist_id)
             stats = ctx.cache.stats(task.artist_id)
             posts_str = f"{stats['done']}/{stats['total']}"
-            print(f"{task.task_type:<10} {task.status:<10} {elapsed:<10} {posts_str:<9} {name}")
-        print()
+            lines.append(f"{task.task_type:<10} {task.status:<10} {elapsed:<10} {posts_str:<9} {name}")
+        lines.append("")
 
     if queued_tasks and len(queued_tasks) > 0:
-        print("-" * 80)
-        print(f"QUEUED TASKS ({len(queued_tasks)})")
-        print("-" * 80)
-        print(f"{'Type':<10} {'Posts':<9} Artist")
-        print("-" * 80)
+        lines.append(SEP80_DASH)
+        lines.append(f"QUEUED TASKS ({len(queued_tasks)})")
+        lines.append(SEP80_DASH)
+        lines.append(f"{'Type':<10} {'Posts':<9} Artist")
+        lines.append(SEP80_DASH)
         for task in queued_tasks[:10]:
-            artist = ctx.storage.get_artist(task.artist_id)
-            name = artist.display_name() if artist else task.artist_id
+            name = name_by_id.get(task.artist_id, task.artist_id)
             stats = ctx.cache.stats(task.artist_id)
             posts_str = f"{stats['done']}/{stats['total']}"
-            print(f"{task.task_type:<10} {posts_str:<9} {name}")
+            lines.append(f"{task.task_type:<10} {posts_str:<9} {name}")
         if len(queued_tasks) > 10:
-            print(f"\n... and {len(queued_tasks) - 10} more tasks")
-        print()
+            lines.append(f"\n... and {len(queued_tasks) - 10} more tasks")
+        lines.append("")
 
-    print("=" * 80)
+    lines.append(SEP80_EQ)
+    print("\n".join(lines))
 
 
 def cmd_cancel_all(ctx: CLIContext):
@@ -1614,8 +1697,8 @@ def cmd_cancel_all(ctx: CLIContext):
     print(f"  Running: {status.running}")
     print()
 
-    confirm = input("Cancel all tasks? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    confirm = input("Cancel all tasks? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
@@ -1643,10 +1726,10 @@ def cmd_validate_artist(ctx: CLIContext):
         print("Run 'update-cache-basic' or 'update-cache-full' first to fetch posts")
         return
 
-    config = ctx.storage.load_config()
+    config = ctx.config
 
     print(f"\n{artist.display_name()} - Validating paths...")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     print("\nValidation level:")
     print("1. Artist folder only")
@@ -1661,20 +1744,17 @@ def cmd_validate_artist(ctx: CLIContext):
     else:
         level = ValidationLevel(artist_unique=True, post_unique=True, file_unique=True)
 
-    validation_data = Validator.build_validation_data([(artist, posts)], config)
+    validation_data = Validator.build_validation_data([(artist, posts)], config,
+                                                      include_posts=level.post_unique or level.file_unique,
+                                                      include_files=level.file_unique)
 
     if not validation_data.artists:
         print("No files found in posts")
         return
 
-    total_files = sum(
-        len(post.files)
-        for artist_data in validation_data.artists
-        for post in artist_data.posts
-    )
-
     # Validate with automatic ignore management
-    conflicts, filtered_count = ctx.validator.validate_full_paths(validation_data, level)
+    report = ctx.validator.validate_full_paths(validation_data, level)
+    conflicts, filtered_count = report.conflicts, report.filtered_count
     ignore_file = ctx.validator.get_ignore_file_path()
 
     if filtered_count > 0:
@@ -1682,22 +1762,24 @@ def cmd_validate_artist(ctx: CLIContext):
 
     if not conflicts:
         print("\n✓ No conflicts found!")
-        print(f"Total files checked: {total_files}")
+        print(f"Total files checked: {report.total_files}")
         print(f"\nValidation ignore file updated: {ignore_file}")
     else:
         print(f"\n✗ Found {len(conflicts)} conflicts:")
-        print("-" * 80)
+        print(SEP80_DASH)
 
+        # The list can be long; write it in one go
+        lines = []
         for path, ids in conflicts:
-            print(f"\nPath: {path}")
-            print(f"Conflicts: {len(ids)} items")
-            print(f"IDs:")
-            for id_str in ids:
-                print(f"  - {id_str}")
+            lines.append(f"\nPath: {path}")
+            lines.append(f"Conflicts: {len(ids)} items")
+            lines.append("IDs:")
+            lines.extend(f"  - {':'.join(item_id)}" for item_id in ids)
+        print("\n".join(lines))
 
-        print("-" * 80)
+        print(SEP80_DASH)
         print(f"Total conflicts: {len(conflicts)}")
-        print(f"Total files checked: {total_files}")
+        print(f"Total files checked: {report.total_files}")
 
         print(f"\nValidation ignore file updated: {ignore_file}")
         print("Edit the 'ignores' array to mark paths you want to ignore")
@@ -1707,15 +1789,15 @@ def cmd_validate_artist(ctx: CLIContext):
 
 def cmd_validate_all_artists(ctx: CLIContext):
     """Validate all paths"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
 
-    config = ctx.storage.load_config()
+    config = ctx.config
 
     print(f"\nValidating paths for {len(artists)} artists...")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     print("\nValidation level:")
     print("1. Artist folder only")
@@ -1730,82 +1812,78 @@ def cmd_validate_all_artists(ctx: CLIContext):
     else:
         level = ValidationLevel(artist_unique=True, post_unique=True, file_unique=True)
 
-    artists_with_posts = []
-    for artist in artists:
-        if artist.ignore:
-            continue
-        posts = ctx.cache.load_posts(artist.id)
-        if posts:
-            artists_with_posts.append((artist, posts))
+    posts_map = ctx.cache.load_posts_many([a.id for a in artists if not a.ignore])
+    artists_with_posts = [(a, posts_map[a.id]) for a in artists if a.id in posts_map]
 
     if not artists_with_posts:
         print("\nNo files found in cached posts")
         print("Run 'update-all-basic' or 'update-all-full' first to fetch posts")
         return
 
-    validation_data = Validator.build_validation_data(artists_with_posts, config)
-
-    total_posts = sum(len(a.posts) for a in validation_data.artists)
-    total_files = sum(
-        len(post.files)
-        for artist_data in validation_data.artists
-        for post in artist_data.posts
-    )
+    validation_data = Validator.build_validation_data(artists_with_posts, config,
+                                                      include_posts=level.post_unique or level.file_unique,
+                                                      include_files=level.file_unique)
 
     print(f"\nCollected data:")
     print(f"  Artists with cache: {len(validation_data.artists)}")
-    print(f"  Total posts: {total_posts}")
-    print(f"  Total files: {total_files}")
+    print(f"  Total posts: {validation_data.total_posts}")
+    print(f"  Total files: {validation_data.total_files}")
     print("\nValidating...")
 
+    artist_map = {a.id: a for a in artists}
+
     # Validate with automatic ignore management
-    conflicts, filtered_count = ctx.validator.validate_full_paths(validation_data, level)
+    report = ctx.validator.validate_full_paths(validation_data, level)
+    conflicts, filtered_count = report.conflicts, report.filtered_count
     ignore_file = ctx.validator.get_ignore_file_path()
 
     if filtered_count > 0:
         print(f"Filtered {filtered_count} ignored conflicts")
 
     # Group conflicts by artist for display
-    artist_conflicts = defaultdict(list)
+    artist_conflicts = {}
     for path, ids in conflicts:
-        if ids:
-            artist_id = ids[0].split(':')[0]
-            artist_conflicts[artist_id].append((path, ids))
+        if not ids:
+            continue
+        artist_id = ids[0][0]
+        artist_conflicts.setdefault(artist_id, []).append((path, ids))
 
-    print("-" * 80)
+    print(SEP80_DASH)
     if not conflicts:
         print("\n✓ No conflicts found!")
     else:
         print(f"\n✗ Found {len(conflicts)} conflicts across {len(artist_conflicts)} artists")
         print("\nConflicts by artist:")
-        print("-" * 80)
+        print(SEP80_DASH)
 
-        artist_map = {a.id: a for a in artists}
-        for artist_id, artist_conflict_list in sorted(artist_conflicts.items(),
-                                                      key=lambda x: len(x[1]),
-                                                      reverse=True):
+        # Count each artist's conflicts once, for sorting and display
+        counted = [(artist_id, conflict_list, len(conflict_list)) for artist_id, conflict_list in artist_conflicts.items()]
+        lines = []
+        for artist_id, artist_conflict_list, count in sorted(counted, key=itemgetter(2), reverse=True):
             artist = artist_map.get(artist_id)
             artist_name = artist.display_name() if artist else artist_id
-            print(f"\n{artist_name} ({artist_id}):")
-            print(f"  Conflicts: {len(artist_conflict_list)}")
+            lines.append(f"\n{artist_name} ({artist_id}):")
+            lines.append(f"  Conflicts: {count}")
 
-            for path, ids in artist_conflict_list[:3]:
-                print(f"    - {path} ({len(ids)} items)")
+            for path, ids in islice(artist_conflict_list, 3):
+                lines.append(f"    - {path} ({len(ids)} items)")
 
-            if len(artist_conflict_list) > 3:
-                print(f"    ... and {len(artist_conflict_list) - 3} more")
+            remaining = count - 3
+            if remaining > 0:
+                lines.append(f"    ... and {remaining} more")
+        print("\n".join(lines))
 
     # Show updated file
-    print(f"\n{'='*80}")
+    print(f"\n{SEP80_EQ}")
     print(f"Validation ignore file updated: {ignore_file}")
     print(f"Updated {len(validation_data.artists)} artists")
     if conflicts:
         print("\nEdit the 'ignores' array for each artist to mark paths you want to ignore")
 
-    print(f"\n{'='*80}")
+    print(f"\n{SEP80_EQ}")
     print(f"Summary:")
     print(f"  Total conflicts: {len(conflicts)}")
-    print(f"  Total files checked: {total_files}")
+    print(f"  Total files checked: {report.total_files}")
     print()
 
 
@@ -1818,19 +1896,23 @@ def cmd_migrate_posts(ctx: CLIContext):
     artist = select_artist(ctx)
     if not artist:
         return
+    artist_name = artist.display_name()
 
-    print(f"\nMigrate Post Folders: {artist.display_name()}")
-    print("-" * 80)
+    print(f"\nMigrate Post Folders: {artist_name}")
+    print(SEP80_DASH)
     print("This will migrate post folders based on template changes.")
     print("Only one-to-one mappings will be migrated (conflicts skipped).")
     print()
 
-    config = ctx.storage.load_config()
+    config = ctx.config
+    # Current templates, artist overrides taking precedence
+    templates = {key: artist.config.get(key, getattr(config, key))
+                 for key in ('artist_folder_template', 'post_folder_template')}
 
     print("Current templates:")
     print(f"  Download dir: {config.download_dir}")
-    print(f"  Artist:       {artist.config.get('artist_folder_template', config.artist_folder_template)}")
-    print(f"  Post:         {artist.config.get('post_folder_template', config.post_folder_template)}")
+    print(f"  Artist:       {templates['artist_folder_template']}")
+    print(f"  Post:         {templates['post_folder_template']}")
     print(f"  Date format:  {config.date_format}")
     print()
 
@@ -1842,12 +1924,12 @@ def cmd_migrate_posts(ctx: CLIContext):
     print("Enter artist_folder_template (or press Enter to use current):")
     artist_template = input("> ").strip()
     if not artist_template:
-        artist_template = artist.config.get('artist_folder_template', config.artist_folder_template)
+        artist_template = templates['artist_folder_template']
 
     print("Enter OLD post_folder_template (or press Enter to use current):")
     old_post_template = input("> ").strip()
     if not old_post_template:
-        old_post_template = artist.config.get('post_folder_template', config.post_folder_template)
+        old_post_template = templates['post_folder_template']
 
     print("Enter NEW post_folder_template:")
     new_post_template = input("> ").strip()
@@ -1883,9 +1965,9 @@ def cmd_migrate_posts(ctx: CLIContext):
     print("\nGenerating migration plan...")
     plan = ctx.migrator.migrate_posts(artist, old_config, new_config)
 
-    print(f"\n{'='*80}")
-    print(f"Migration Plan: {artist.display_name()}")
-    print(f"{'='*80}")
+    print(f"\n{SEP80_EQ}")
+    print(f"Migration Plan: {artist_name}")
+    print(f"{SEP80_EQ}")
     print(f"Total posts: {plan.total_items}")
     print(f"Can migrate: {plan.success_count}")
     print(f"Conflicts: {plan.conflict_count}")
@@ -1893,10 +1975,11 @@ def cmd_migrate_posts(ctx: CLIContext):
 
     if plan.conflicts:
         print(f"\nPath conflicts: {len(plan.conflicts)}")
-        for path, ids in plan.conflicts[:3]:
+        for path, ids in islice(plan.conflicts, 3):
             print(f"  {path} ({len(ids)} posts)")
-        if len(plan.conflicts) > 3:
-            print(f"  ... and {len(plan.conflicts) - 3} more")
+        remaining = len(plan.conflicts) - 3
+        if remaining > 0:
+            print(f"  ... and {remaining} more")
 
     if plan.skipped:
         skipped_by_reason = {}
@@ -1908,7 +1991,7 @@ def cmd_migrate_posts(ctx: CLIContext):
 
     if plan.mappings:
         print(f"\nSample mappings (first 3):")
-        for old_path, new_path, post_id in plan.mappings[:3]:
+        for old_path, new_path, post_id in islice(plan.mappings, 3):
             print(f"\n  Post: {post_id}")
             print(f"    From: {old_path}")
             print(f"    To:   {new_path}")
@@ -1917,18 +2000,18 @@ def cmd_migrate_posts(ctx: CLIContext):
         print("\n⚠ No posts to migrate")
         return
 
-    print(f"\n{'='*80}")
-    confirm = input(f"Migrate {plan.success_count} posts? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    print(f"\n{SEP80_EQ}")
+    confirm = input(f"Migrate {plan.success_count} posts? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
     print("\nMigrating...")
     result = ctx.migrator.execute_migration(plan)
 
-    print(f"\n{'='*80}")
+    print(f"\n{SEP80_EQ}")
     print(f"Migration Results")
-    print(f"{'='*80}")
+    print(f"{SEP80_EQ}")
     print(f"Total: {result.total}")
     print(f"Success: {result.success}")
     print(f"Failed: {len(result.failed)}")
@@ -1956,20 +2039,24 @@ def cmd_migrate_files(ctx: CLIContext):
     artist = select_artist(ctx)
     if not artist:
         return
+    artist_name = artist.display_name()
 
-    print(f"\nMigrate Files: {artist.display_name()}")
-    print("-" * 80)
+    print(f"\nMigrate Files: {artist_name}")
+    print(SEP80_DASH)
     print("This will migrate files within post folders.")
     print("Only one-to-one mappings will be migrated (conflicts skipped).")
     print()
 
-    config = ctx.storage.load_config()
+    config = ctx.config
+    # Current templates, artist overrides taking precedence
+    templates = {key: artist.config.get(key, getattr(config, key))
+                 for key in ('artist_folder_template', 'post_folder_template', 'file_template')}
 
     print("Current templates:")
     print(f"  Download dir:        {config.download_dir}")
-    print(f"  Artist:              {artist.config.get('artist_folder_template', config.artist_folder_template)}")
-    print(f"  Post:                {artist.config.get('post_folder_template', config.post_folder_template)}")
-    print(f"  File:                {artist.config.get('file_template', config.file_template)}")
+    print(f"  Artist:              {templates['artist_folder_template']}")
+    print(f"  Post:                {templates['post_folder_template']}")
+    print(f"  File:                {templates['file_template']}")
     print(f"  Date format:         {config.date_format}")
     print(f"  Rename images only:  {config.rename_images_only}")
     print(f"  Image extensions:    {', '.join(config.image_extensions)}")
@@ -1983,12 +2070,12 @@ def cmd_migrate_files(ctx: CLIContext):
     print("Enter artist_folder_template (or press Enter to use current):")
     artist_template = input("> ").strip()
     if not artist_template:
-        artist_template = artist.config.get('artist_folder_template', config.artist_folder_template)
+        artist_template = templates['artist_folder_template']
 
     print("Enter post_folder_template (or press Enter to use current):")
     post_template = input("> ").strip()
     if not post_template:
-        post_template = artist.config.get('post_folder_template', config.post_folder_template)
+        post_template = templates['post_folder_template']
 
     print("Enter date_format (or press Enter to use current):")
     date_format = input("> ").strip()
@@ -1998,7 +2085,7 @@ def cmd_migrate_files(ctx: CLIContext):
     print("Enter OLD file_template (or press Enter to use current):")
     old_file_template = input("> ").strip()
     if not old_file_template:
-        old_file_template = artist.config.get('file_template', config.file_template)
+        old_file_template = templates['file_template']
 
     print("Enter NEW file_template:")
     new_file_template = input("> ").strip()
@@ -2044,9 +2131,9 @@ def cmd_migrate_files(ctx: CLIContext):
     print("\nGenerating migration plan...")
     plan = ctx.migrator.migrate_files(artist, old_config, new_config)
 
-    print(f"\n{'='*80}")
-    print(f"Migration Plan: {artist.display_name()}")
-    print(f"{'='*80}")
+    print(f"\n{SEP80_EQ}")
+    print(f"Migration Plan: {artist_name}")
+    print(f"{SEP80_EQ}")
     print(f"Total files: {plan.total_items}")
     print(f"Can migrate: {plan.success_count}")
     print(f"Conflicts: {plan.conflict_count}")
@@ -2065,7 +2152,7 @@ def cmd_migrate_files(ctx: CLIContext):
 
     if plan.mappings:
         print(f"\nSample mappings (first 3):")
-        for old_path, new_path, file_key in plan.mappings[:3]:
+        for old_path, new_path, file_key in islice(plan.mappings, 3):
             print(f"\n  File: {file_key}")
             print(f"    From: {old_path}")
             print(f"    To:   {new_path}")
@@ -2074,18 +2161,18 @@ def cmd_migrate_files(ctx: CLIContext):
         print("\n⚠ No files to migrate")
         return
 
-    print(f"\n{'='*80}")
-    confirm = input(f"Migrate {plan.success_count} files? (yes/no): ").strip().lower()
-    if confirm != "yes":
+    print(f"\n{SEP80_EQ}")
+    confirm = input(f"Migrate {plan.success_count} files? (yes/no): ")
+    if not _is_yes(confirm):
         print("Cancelled")
         return
 
     print("\nMigrating...")
     result = ctx.migrator.execute_migration(plan)
 
-    print(f"\n{'='*80}")
+    print(f"\n{SEP80_EQ}")
     print(f"Migration Results")
-    print(f"{'='*80}")
+    print(f"{SEP80_EQ}")
     print(f"Total: {result.total}")
     print(f"Success: {result.success}")
     print(f"Failed: {len(result.failed)}")
@@ -2147,7 +2234,7 @@ def cmd_config_artist(ctx: CLIContext):
             artist.completed = new_config.get("completed", False)
             artist.last_date = new_config.get("last_date")
 
-            ctx.storage.save_artist(artist)
+            ctx.save_artist(artist)
             print(f"✓ Configuration saved for {artist.display_name()}")
         except Exception as e:
             print(f"✗ Failed to save: {e}")
@@ -2226,6 +2313,7 @@ def cmd_config_global(ctx: CLIContext):
             config.global_filter = new_config.get("global_filter", {})
 
             ctx.storage.save_config(config)
+            ctx.config = config
             print("✓ Global configuration saved")
         except Exception as e:
             print(f"✗ Failed to save: {e}")
@@ -2334,7 +2422,7 @@ def cmd_extract_links(ctx: CLIContext, match: str = "", unique: str = "true", sh
         return
 
     print(f"\nExtracting links from: {artist.display_name()}")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     # Parse parameters
     match_pattern = match.strip() or None
@@ -2363,7 +2451,7 @@ def cmd_extract_links(ctx: CLIContext, match: str = "", unique: str = "true", sh
         print(f"Found {len(links)} links from {len(set(link.post_id for link in links))} posts")
         print()
         print("Links by domain:")
-        print("-" * 80)
+        print(SEP80_DASH)
 
         idx = 1
         for domain in sorted(links_by_domain.keys()):
@@ -2376,7 +2464,7 @@ def cmd_extract_links(ctx: CLIContext, match: str = "", unique: str = "true", sh
         if show_stats_bool:
             print()
             print("Statistics:")
-            print("-" * 80)
+            print(SEP80_DASH)
 
             stats = ctx.external_links_extractor.get_link_statistics(links)
             print(f"Total links: {stats['total_links']}")
@@ -2390,7 +2478,7 @@ def cmd_extract_links(ctx: CLIContext, match: str = "", unique: str = "true", sh
                     print(f"  {domain}: {count} links")
 
         print()
-        print("=" * 80)
+        print(SEP80_EQ)
 
     except Exception as e:
         print(f"✗ Error extracting links: {e}")
@@ -2398,7 +2486,7 @@ def cmd_extract_links(ctx: CLIContext, match: str = "", unique: str = "true", sh
 
 def cmd_extract_all_links(ctx: CLIContext, match: str = "", unique: str = "true", show_stats: str = "true"):
     """Extract external links from all artists' cached posts"""
-    artists = ctx.storage.get_artists()
+    artists = ctx.artists_snapshot()
     if not artists:
         print("No artists found")
         return
@@ -2409,7 +2497,7 @@ def cmd_extract_all_links(ctx: CLIContext, match: str = "", unique: str = "true"
         return
 
     print(f"\nExtracting links from {len(active_artists)} artists...")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     # Parse parameters
     match_pattern = match.strip() or None
@@ -2443,7 +2531,7 @@ def cmd_extract_all_links(ctx: CLIContext, match: str = "", unique: str = "true"
         print(f"\nFound {len(all_links)} total links")
         print()
         print("Results by artist:")
-        print("-" * 80)
+        print(SEP80_DASH)
 
         idx = 1
         for artist in active_artists:
@@ -2460,9 +2548,9 @@ def cmd_extract_all_links(ctx: CLIContext, match: str = "", unique: str = "true"
 
         if show_stats_bool:
             print()
-            print("=" * 80)
+            print(SEP80_EQ)
             print("Statistics:")
-            print("-" * 80)
+            print(SEP80_DASH)
 
             stats = ctx.external_links_extractor.get_link_statistics(all_links)
             print(f"Total links: {stats['total_links']}")
@@ -2477,7 +2565,7 @@ def cmd_extract_all_links(ctx: CLIContext, match: str = "", unique: str = "true"
                     print(f"  {domain}: {count} links")
 
         print()
-        print("=" * 80)
+        print(SEP80_EQ)
 
     except Exception as e:
         print(f"✗ Error extracting links: {e}")
@@ -2490,7 +2578,7 @@ def cmd_download_gdrive_links(ctx: CLIContext, match: str = "", unique: str = "t
         return
 
     print(f"\nDownloading Google Drive links from: {artist.display_name()}")
-    print("-" * 80)
+    print(SEP80_DASH)
 
     # Parse parameters
     match_pattern = match.strip() or None
@@ -2536,7 +2624,7 @@ def cmd_history(ctx: CLIContext, limit: str = "10"):
             return
 
         print(f"\n{'#':<4} {'Status':<8} {'Timestamp':<20} {'Command':<40}")
-        print("=" * 80)
+        print(SEP80_EQ)
 
         for i, record in enumerate(records, 1):
             status = "✓ OK" if record.success else "✗ ERR"
@@ -2565,7 +2653,7 @@ def cmd_history(ctx: CLIContext, limit: str = "10"):
                 if record.note:
                     print(f"{prefix}Error: {record.note}")
 
-        print("=" * 80)
+        print(SEP80_EQ)
 
         # Ask if user wants to re-execute
         choice = input("\nRe-execute? (enter number or skip): ").strip().lower()
@@ -2606,7 +2694,8 @@ def cmd_history(ctx: CLIContext, limit: str = "10"):
 
 def cmd_clear(ctx: CLIContext = None):
     """Clear screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Writes the escape sequence (or console API call on Windows) directly, no shell spawn
+    clear()
 
 
 def cmd_exit(ctx: CLIContext):
@@ -2615,8 +2704,8 @@ def cmd_exit(ctx: CLIContext):
     status = ctx.scheduler.get_queue_status()
     if status.running > 0 or status.queued > 0:
         print(f"\n⚠ Warning: {status.running} running and {status.queued} queued tasks")
-        confirm = input("Force quit and stop all tasks? (yes/no): ").strip().lower()
-        if confirm != "yes":
+        confirm = input("Force quit and stop all tasks? (yes/no): ")
+        if not _is_yes(confirm):
             print("Exit cancelled")
             return
 
@@ -2707,3 +2796,15 @@ COMMAND_MAP = {
     'extract-all-links': cmd_extract_all_links,
     'download-gdrive-links': cmd_download_gdrive_links,
 }
+
+
+def handler_params(handler) -> frozenset:
+    """Parameter names a command handler accepts, besides ctx
+
+    Read from the code object; inspect.signature is much slower and this
+    runs for every command.
+    """
+    code = handler.__code__
+    count = code.co_argcount + code.co_kwonlyargcount
+    count += bool(code.co_flags & inspect.CO_VARARGS) + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+    return frozenset(code.co_varnames[:count]) - {'ctx'}
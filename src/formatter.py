@@ -1,7 +1,9 @@
 import re
+import string
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet, List, Optional
 
 from .models import ArtistFolderParams, FileParams, PostFolderParams
 from .plugins import dynamic_call
@@ -40,7 +42,9 @@ class Formatter:
     @dynamic_call(func_name='format_post_plugin', module_filename='./plugins/format_plugin.py', default=lambda func: func)
     def format_post_folder(params: PostFolderParams, template: str, date_format: str) -> Path:
         """Format post folder path"""
-        published_str = Formatter._format_date(params.published, date_format)
+        # Date formatting is the costly part, skip it when the template has no {published}
+        fields = Formatter._template_fields(template)
+        published_str = Formatter._format_date(params.published, date_format) if fields is None or 'published' in fields else ""
         path_raw = template.format(
             id=params.id,
             user=params.user,
@@ -96,6 +100,25 @@ class Formatter:
 
     # ==================== Private ====================
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _template_fields(template: str) -> Optional[FrozenSet[str]]:
+        """Field names used by a format template, parsed once per template
+
+        Returns None if the template can't be parsed or nests fields in a format spec.
+        """
+        fields = set()
+        try:
+            for _, field_name, format_spec, _ in string.Formatter().parse(template):
+                if field_name is None:
+                    continue
+                if format_spec and '{' in format_spec:
+                    return None
+                fields.add(re.split(r'[.\[]', field_name, maxsplit=1)[0])
+        except ValueError:
+            return None
+        return frozenset(fields)
+
     @staticmethod
     def _sanitize(text: str) -> str:
         """Sanitize path component"""
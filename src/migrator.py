@@ -1,4 +1,6 @@
+import os
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .cache import Cache
@@ -269,15 +271,36 @@ class Migrator:
             failed=[]
         )
 
-        for old_path, new_path, item_id in plan.mappings:
-            try:
-                old_path_obj = Path(old_path)
-                new_path_obj = Path(new_path)
+        if not plan.mappings:
+            return results
 
-                new_path_obj.parent.mkdir(parents=True, exist_ok=True)
-                old_path_obj.rename(new_path_obj)
+        # Create destination folders up front, once each, so the renames below don't race on them
+        dir_errors = {}
+        for parent in dict.fromkeys(os.path.dirname(new_path) for _, new_path, _ in plan.mappings):
+            try:
+                os.makedirs(parent, exist_ok=True)
+            except Exception as e:
+                dir_errors[parent] = str(e)
+
+        # Renames block in the OS with the GIL released, so they overlap across threads.
+        # If a target is also a source (A -> B, B -> C), run them one by one in plan order
+        sources = {os.path.normcase(os.path.abspath(old_path)) for old_path, _, _ in plan.mappings}
+        chained = any(os.path.normcase(os.path.abspath(new_path)) in sources for _, new_path, _ in plan.mappings)
+        max_workers = 1 if chained else min(32, len(plan.mappings))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                None if os.path.dirname(new_path) in dir_errors else executor.submit(os.rename, old_path, new_path)
+                for old_path, new_path, _ in plan.mappings
+            ]
+
+        for (old_path, new_path, item_id), future in zip(plan.mappings, futures):
+            if future is None:
+                results.failed.append((old_path, new_path, item_id, dir_errors[os.path.dirname(new_path)]))
+                continue
+            try:
+                future.result()
                 results.success += 1
-
             except Exception as e:
                 results.failed.append((old_path, new_path, item_id, str(e)))
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional, Tuple
 
 
 # ==================== Constants ====================
@@ -11,7 +12,7 @@ NO_CONTENT_MARKER = "<NO_CONTENT>"
 
 # ==================== History ====================
 
-@dataclass
+@dataclass(slots=True)
 class HistoryRecord:
     """Command history record"""
     command: str
@@ -26,7 +27,11 @@ class HistoryRecord:
 
 @dataclass
 class Artist:
-    """Artist/Creator information"""
+    """Artist/Creator information
+
+    Instances are snapshots loaded from storage for one command; name and alias are
+    never edited in place, so values derived from them may be cached on the instance.
+    """
     id: str
     service: str
     user_id: str
@@ -43,6 +48,11 @@ class Artist:
     def display_name(self) -> str:
         return self.alias or self.name
 
+    @cached_property
+    def lowered(self) -> Tuple[str, str, str, str]:
+        """Lowercased (id, name, alias, display name), computed once for matching"""
+        return (self.id.lower(), self.name.lower(), (self.alias or '').lower(), self.display_name().lower())
+
 
 @dataclass
 class Post:
@@ -323,6 +333,21 @@ class ValidationData:
     Each artist has its own config (global config merged with artist-specific overrides).
     """
     artists: List[ValidationArtistData]
+    total_posts: int = 0  # Counted while building
+    total_files: int = 0
+
+
+@dataclass
+class ValidationReport:
+    """Validation result: conflicts left after ignores, plus what was checked"""
+    conflicts: List[tuple]  # [(path, [ids])], ids are (artist_id[, post_id[, file_name]]) tuples
+    filtered_count: int  # Conflicts dropped by ignores
+    total_posts: int
+    total_files: int
+
+    def as_tuple(self) -> Tuple[List[tuple], int]:
+        """Return (conflicts, filtered_count)"""
+        return self.conflicts, self.filtered_count
 
 
 # ==================== Scheduler Models ====================
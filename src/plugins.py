@@ -1,6 +1,6 @@
 """Minimal dynamic plugin loader.
 
-Reloads plugin file on every call so edits take effect immediately.
+Reloads plugin file whenever it changes on disk so edits take effect immediately.
 
 Functions:
     dynamic_call: Call a function from plugin file
@@ -32,12 +32,23 @@ import pathlib
 import types
 from typing import Any
 
+# Loaded modules by path, with the (mtime_ns, size) of the file they were loaded from
+_module_cache: dict[pathlib.Path, tuple[tuple[int, int], types.ModuleType]] = {}
+
 
 def _load_module(module_filename: str) -> types.ModuleType:
     base_dir = pathlib.Path(__file__).resolve().parent.parent  # project root
     path = base_dir / module_filename
-    if not path.exists():
-        raise FileNotFoundError(f"Plugin file not found: {path}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Plugin file not found: {path}") from None
+
+    # Reuse the module while the file is unchanged
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _module_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
 
     # Determine module name and package for proper relative imports
     module_path = pathlib.Path(module_filename)
@@ -62,11 +73,12 @@ def _load_module(module_filename: str) -> types.ModuleType:
         module.__package__ = package
 
     spec.loader.exec_module(module)  # type: ignore[arg-type]
+    _module_cache[path] = (stamp, module)
     return module
 
 
 def dynamic_call(func_name: str, module_filename: str, *args: Any, default=None, **kwargs: Any) -> Any:
-    """Call function from plugin file (reload on each call)"""
+    """Call function from plugin file (reloaded when the file changes)"""
     if not module_filename:
         raise ValueError("module_filename must be provided")
     module = _load_module(module_filename)
@@ -79,7 +91,7 @@ def dynamic_call(func_name: str, module_filename: str, *args: Any, default=None,
 
 
 def dynamic_get(var_name: str, module_filename: str, default=None) -> Any:
-    """Get variable from plugin file (reload on each call)"""
+    """Get variable from plugin file (reloaded when the file changes)"""
     if not module_filename:
         raise ValueError("module_filename must be provided")
     module = _load_module(module_filename)
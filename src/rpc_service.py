@@ -1,4 +1,3 @@
-import inspect
 import threading
 from contextlib import redirect_stdout, redirect_stderr
 from io import StringIO
@@ -44,7 +43,7 @@ class DownloaderService(rpyc.Service):
             return {"error": "Service not initialized"}
 
         try:
-            from .cmd import COMMAND_MAP
+            from .cmd import COMMAND_MAP, handler_params
 
             command, params = self.parse_command(cmd_input)
 
@@ -56,12 +55,11 @@ class DownloaderService(rpyc.Service):
             if not handler:
                 return {"error": f"Unknown command: {command}"}
 
-            sig = inspect.signature(handler)
-            handler_params = set(sig.parameters.keys()) - {'ctx'}
+            accepted = handler_params(handler)
 
             if params:
-                valid_params = {k: v for k, v in params.items() if k in handler_params}
-                invalid_params = set(params.keys()) - handler_params
+                valid_params = {k: v for k, v in params.items() if k in accepted}
+                invalid_params = set(params.keys()) - accepted
                 warning = f"Warning: '{command}' doesn't support parameters: {', '.join(invalid_params)}\n" if invalid_params else ""
             else:
                 valid_params = {}
@@ -70,6 +68,8 @@ class DownloaderService(rpyc.Service):
             output_buffer = StringIO()
             error_buffer = StringIO()
 
+            self.ctx.begin_command()
+
             with redirect_stdout(output_buffer), redirect_stderr(error_buffer):
                 try:
                     handler(self.ctx, **valid_params)
@@ -3,7 +3,7 @@ import threading
 from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from queue import Queue
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .storage import Storage
 from .downloader import Downloader
@@ -100,26 +100,38 @@ class Scheduler:
         self, artist_id: str, from_date: Optional[str] = None, until_date: Optional[str] = None
     ) -> bool:
         task = DownloadTask(artist_id, from_date, until_date, TaskType.MANUAL)
-        return self._add_task(task)
+        return self._add_tasks([task]) == 1
 
     def queue_batch(self, artist_ids: List[str]) -> int:
-        added = 0
-        for artist_id in artist_ids:
-            task = DownloadTask(artist_id, None, None, TaskType.MANUAL)
-            if self._add_task(task):
-                added += 1
-        self.logger.scheduler_batch_queued(count=added, requested=len(artist_ids))
+        return self.queue_batch_with_ranges([(artist_id, None, None) for artist_id in artist_ids])
+
+    def queue_batch_with_ranges(
+        self, ranges: List[Tuple[str, Optional[str], Optional[str]]]
+    ) -> int:
+        """Queue (artist_id, from_date, until_date) manual tasks under a single lock"""
+        tasks = [
+            DownloadTask(artist_id, from_date, until_date, TaskType.MANUAL)
+            for artist_id, from_date, until_date in ranges
+        ]
+        added = self._add_tasks(tasks)
+        self.logger.scheduler_batch_queued(count=added, requested=len(tasks))
         return added
 
     def _add_task(self, task: DownloadTask) -> bool:
+        return self._add_tasks([task]) == 1
+
+    def _add_tasks(self, tasks: List[DownloadTask]) -> int:
+        added = 0
         with self.lock:
-            if task in self.queued_tasks:
-                self.logger.scheduler_task_duplicate(artist_id=task.artist_id, type=task.task_type)
-                return False
-            self.queued_tasks.add(task)
-            self.task_queue.put(task)
-            self.logger.scheduler_task_queued(artist_id=task.artist_id, type=task.task_type)
-            return True
+            for task in tasks:
+                if task in self.queued_tasks:
+                    self.logger.scheduler_task_duplicate(artist_id=task.artist_id, type=task.task_type)
+                    continue
+                self.queued_tasks.add(task)
+                self.task_queue.put(task)
+                self.logger.scheduler_task_queued(artist_id=task.artist_id, type=task.task_type)
+                added += 1
+        return added
 
     def get_queue_status(self) -> QueueStatus:
         with self.lock:
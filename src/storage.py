@@ -1,9 +1,10 @@
-import json
 import threading
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import Artist, Config, HistoryRecord
+from .utils import Utils
 
 
 class Storage:
@@ -15,6 +16,12 @@ class Storage:
         self.config_file = self.data_dir / "config.json"
         self.history_file = self.data_dir / "history.json"
         self.lock = threading.Lock()
+        # Bumped on every artist save/remove, so callers can tell when a loaded list is stale
+        self.artists_revision = 0
+        # (mtime_ns, size, content hash) of each file as last read or written
+        self._file_hash: Dict[Path, Tuple[int, int, int]] = {}
+        # Parsed content of each file as last read, keyed to its (mtime_ns, size)
+        self._json_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
         self._ensure_files()
 
     def _ensure_files(self):
@@ -25,9 +32,43 @@ class Storage:
         if not self.history_file.exists():
             self.history_file.write_text("[]", encoding='utf-8')
 
+    def _read_json(self, path: Path) -> Any:
+        """Internal: Read JSON file, reusing the parsed content while it is unchanged (not thread-safe)
+
+        The returned object is shared with the cache and must not be modified in place.
+        """
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        raw = path.read_bytes()
+        data = Utils.json_loads(raw)
+        self._file_hash[path] = (*stamp, hash(raw))
+        self._json_cache[path] = (stamp, data)
+        return data
+
+    def _write_json(self, path: Path, data: Any):
+        """Internal: Write JSON file, skipping it if the content on disk is unchanged (not thread-safe)"""
+        raw = Utils.json_dumps(data)
+        digest = hash(raw)
+        known = self._file_hash.get(path)
+        if known and known[2] == digest:
+            try:
+                stat = path.stat()
+                if (stat.st_mtime_ns, stat.st_size) == known[:2]:
+                    return
+            except FileNotFoundError:
+                pass
+        path.write_bytes(raw)
+        self._json_cache.pop(path, None)
+        stat = path.stat()
+        self._file_hash[path] = (stat.st_mtime_ns, stat.st_size, digest)
+
     def load_config(self) -> Config:
         with self.lock:
-            data = json.loads(self.config_file.read_text(encoding='utf-8'))
+            data = dict(self._read_json(self.config_file))
             if not data:
                 return Config()
 
@@ -41,105 +82,107 @@ class Storage:
             data = config.__dict__.copy()
             if 'image_extensions' in data and isinstance(data['image_extensions'], set):
                 data['image_extensions'] = list(data['image_extensions'])
-            self.config_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
-
-    def get_artists(self) -> List[Artist]:
-        with self.lock:
-            # Load base list from artists.json
-            data = json.loads(self.artists_file.read_text(encoding='utf-8'))
-            artists = [Artist(**item) for item in data]
-
-            # If there is an artists/ directory, recursively load all JSON files.
-            # artists.json has the highest priority. For IDs not defined there,
-            # the first occurrence in artists/ (by rglob order) wins.
-            if self.artists_dir.exists() and self.artists_dir.is_dir():
-                existing_ids = {a.id for a in artists}
-
-                for json_path in self.artists_dir.rglob('*.json'):
-                    try:
-                        content = json.loads(json_path.read_text(encoding='utf-8'))
-                    except Exception:
-                        continue
-
-                    if isinstance(content, dict):
-                        items = [content]
-                    elif isinstance(content, list):
-                        items = [item for item in content if isinstance(item, dict)]
-                    else:
+            self._write_json(self.config_file, data)
+
+    def _read_raw_artists(self) -> List[Dict]:
+        """Internal: Read merged artist dicts without lock (not thread-safe)"""
+        # Load base list from artists.json
+        items = list(self._read_json(self.artists_file))
+
+        # If there is an artists/ directory, recursively load all JSON files.
+        # artists.json has the highest priority. For IDs not defined there,
+        # the first occurrence in artists/ (by rglob order) wins.
+        if self.artists_dir.exists() and self.artists_dir.is_dir():
+            existing_ids = {item['id'] for item in items}
+
+            for json_path in self.artists_dir.rglob('*.json'):
+                try:
+                    content = self._read_json(json_path)
+                except Exception:
+                    continue
+
+                if isinstance(content, dict):
+                    file_items = [content]
+                elif isinstance(content, list):
+                    file_items = [item for item in content if isinstance(item, dict)]
+                else:
+                    continue
+
+                for item in file_items:
+                    artist_id = item.get('id')
+                    if not artist_id or artist_id in existing_ids:
                         continue
+                    items.append(item)
+                    existing_ids.add(artist_id)
 
-                    for item in items:
-                        artist_id = item.get('id')
-                        if not artist_id or artist_id in existing_ids:
-                            continue
-                        artists.append(Artist(**item))
-                        existing_ids.add(artist_id)
+        return items
 
-            return artists
+    def get_artists(self) -> List[Artist]:
+        with self.lock:
+            return [Artist(**item) for item in self._read_raw_artists()]
 
     def get_artist(self, artist_id: str) -> Optional[Artist]:
-        artists = self.get_artists()
-        return next((a for a in artists if a.id == artist_id), None)
+        with self.lock:
+            item = next((item for item in self._read_raw_artists() if item['id'] == artist_id), None)
+        return Artist(**item) if item else None
 
     def save_artist(self, artist: Artist):
         with self.lock:
+            self.artists_revision += 1
             # 1) Try update in artists.json (highest priority)
-            data = json.loads(self.artists_file.read_text(encoding='utf-8'))
-            artists = [Artist(**item) for item in data]
-
-            for i, a in enumerate(artists):
-                if a.id == artist.id:
-                    artists[i] = artist
-                    data = [x.__dict__ for x in artists]
-                    self.artists_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+            data = list(self._read_json(self.artists_file))
+
+            for i, item in enumerate(data):
+                if item['id'] == artist.id:
+                    data[i] = asdict(artist)
+                    self._write_json(self.artists_file, data)
                     return
 
             # 2) Not in artists.json -> search artists/ recursively
             if self.artists_dir.exists() and self.artists_dir.is_dir():
                 for json_path in self.artists_dir.rglob('*.json'):
                     try:
-                        content = json.loads(json_path.read_text(encoding='utf-8'))
+                        content = self._read_json(json_path)
                     except Exception:
                         continue
 
                     changed = False
                     if isinstance(content, dict):
                         if content.get('id') == artist.id:
-                            content = artist.__dict__
+                            content = asdict(artist)
                             changed = True
                     elif isinstance(content, list):
                         for idx, item in enumerate(content):
                             if isinstance(item, dict) and item.get('id') == artist.id:
-                                content[idx] = artist.__dict__
+                                content = list(content)
+                                content[idx] = asdict(artist)
                                 changed = True
                                 break
 
                     if changed:
-                        json_path.write_text(json.dumps(content, indent=2, ensure_ascii=False), encoding='utf-8')
+                        self._write_json(json_path, content)
                         return
 
             # 3) Not found anywhere -> append to artists.json
-            artists.append(artist)
-            data = [x.__dict__ for x in artists]
-            self.artists_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+            data.append(asdict(artist))
+            self._write_json(self.artists_file, data)
 
     def remove_artist(self, artist_id: str):
         with self.lock:
+            self.artists_revision += 1
             # 1) Try remove from artists.json
-            data = json.loads(self.artists_file.read_text(encoding='utf-8'))
-            artists = [Artist(**item) for item in data]
+            data = self._read_json(self.artists_file)
 
-            new_artists = [a for a in artists if a.id != artist_id]
-            if len(new_artists) != len(artists):
-                data = [x.__dict__ for x in new_artists]
-                self.artists_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+            new_data = [item for item in data if item['id'] != artist_id]
+            if len(new_data) != len(data):
+                self._write_json(self.artists_file, new_data)
                 return
 
             # 2) Not in artists.json -> search artists/ recursively
             if self.artists_dir.exists() and self.artists_dir.is_dir():
                 for json_path in self.artists_dir.rglob('*.json'):
                     try:
-                        content = json.loads(json_path.read_text(encoding='utf-8'))
+                        content = self._read_json(json_path)
                     except Exception:
                         continue
 
@@ -158,7 +201,7 @@ class Storage:
                         if content is None:
                             json_path.unlink(missing_ok=True)
                         else:
-                            json_path.write_text(json.dumps(content, indent=2, ensure_ascii=False), encoding='utf-8')
+                            self._write_json(json_path, content)
                         return
 
     # ==================== History ====================
@@ -166,7 +209,7 @@ class Storage:
     def add_history(self, command: str, success: bool = True, artist_id: str = None, params: dict = None, note: str = ""):
         """Add a command to history with optional artist_id and parameters"""
         with self.lock:
-            data = json.loads(self.history_file.read_text(encoding='utf-8'))
+            data = list(self._read_json(self.history_file))
             record = HistoryRecord(
                 command=command,
                 success=success,
@@ -174,18 +217,17 @@ class Storage:
                 params=params or {},
                 note=note
             )
-            data.append(record.__dict__)
-            self.history_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
+            data.append(asdict(record))
+            self._write_json(self.history_file, data)
 
     def get_history(self, limit: int = 10) -> List[HistoryRecord]:
         """Get recent command history, newest first"""
         with self.lock:
-            data = json.loads(self.history_file.read_text(encoding='utf-8'))
-            records = [HistoryRecord(**item) for item in data]
-            # Return newest first
-            return records[-limit:][::-1] if len(records) > 0 else []
+            data = self._read_json(self.history_file)
+            # Only build records that are returned, newest first
+            return [HistoryRecord(**item) for item in reversed(data[-limit:])]
 
     def clear_history(self):
         """Clear all history"""
         with self.lock:
-            self.history_file.write_text("[]", encoding='utf-8')
+            self._write_json(self.history_file, [])
@@ -1,7 +1,27 @@
-from typing import Any, List, Mapping, Sequence
+import json
+from pathlib import Path
+from typing import Any, List, Mapping, Optional, Sequence
 
 from .models import Artist, Config, Post
 
+try:
+    import orjson
+except ImportError:  # Optional, the json module is used without it
+    orjson = None
+
+
+# Prefix for site-relative file paths
+_BASE = 'https://kemono.cr'
+
+
+def _file_entry(item: dict, default_name: str) -> Optional[dict]:
+    """Build a {'url', 'name'} entry for a post file/attachment, None without a path"""
+    path = item.get('path')
+    if not path:
+        return None
+    return {'url': path if path.startswith('http') else _BASE + path,
+            'name': item.get('name', default_name)}
+
 
 class Utils:
     """Common utility functions"""
@@ -9,27 +29,43 @@ class Utils:
     @staticmethod
     def get_config_value(artist: Artist, config: Config, key: str, default=None) -> Any:
         """Get config value with artist-level override"""
-        return artist.config.get(key, getattr(config, key, default))
+        overrides = artist.config
+        if key in overrides:
+            return overrides[key]
+        return getattr(config, key, default)
 
     @staticmethod
-    def extract_files(post: Post) -> List[dict]:
-        """Extract file URLs from post"""
-        files = []
+    def json_loads(raw: bytes) -> Any:
+        """Parse UTF-8 JSON bytes, with orjson when installed"""
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
 
-        if post.file:
-            path = post.file.get('path', '')
-            if path and not path.startswith('http'):
-                path = f"https://kemono.cr{path}"
-            files.append({'url': path, 'name': post.file.get('name', 'file')})
+    @staticmethod
+    def json_dumps(data: Any) -> bytes:
+        """Serialize data as indented UTF-8 JSON bytes, with orjson when installed"""
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
 
-        if post.attachments:
-            for att in post.attachments:
-                path = att.get('path', '')
-                if path and not path.startswith('http'):
-                    path = f"https://kemono.cr{path}"
-                files.append({'url': path, 'name': att.get('name', 'attachment')})
+    @staticmethod
+    def read_json(path: Path) -> Any:
+        """Read a UTF-8 JSON file, parsed with orjson when installed"""
+        return Utils.json_loads(path.read_bytes())
+
+    @staticmethod
+    def write_json(path: Path, data: Any):
+        """Write data as indented UTF-8 JSON, serialized with orjson when installed"""
+        path.write_bytes(Utils.json_dumps(data))
 
-        return [f for f in files if f['url']]
+    @staticmethod
+    def extract_files(post: Post) -> List[dict]:
+        """Extract file URLs from post"""
+        files = [entry] if post.file and (entry := _file_entry(post.file, 'file')) else []
+        if post.attachments:
+            files += [entry for att in post.attachments
+                      if (entry := _file_entry(att, 'attachment'))]
+        return files
 
     @staticmethod
     def sequence_contains_all(
@@ -56,20 +92,27 @@ class Utils:
         if not superset_items:
             return False
 
+        candidates = [item for item in superset_items if isinstance(item, Mapping)]
+        # Candidate values per set of compared keys, built on first use
+        indexes = {}
+
         for subset in subset_items:
             if not isinstance(subset, Mapping):
                 continue
 
-            # Determine which keys to compare for this item
-            keys = key_fields or list(subset.keys())
+            # Determine which keys to compare for this item (only those it has)
+            keys = tuple(k for k in (key_fields or subset.keys()) if k in subset)
+            values = tuple(subset[k] for k in keys)
 
-            def is_match(candidate: Mapping[str, Any]) -> bool:
-                for k in keys:
-                    if k in subset and candidate.get(k) != subset[k]:
-                        return False
-                return True
+            try:
+                if keys not in indexes:
+                    indexes[keys] = {tuple(item.get(k) for k in keys) for item in candidates}
+                found = values in indexes[keys]
+            except TypeError:
+                # Unhashable values, compare candidates one by one
+                found = any(all(item.get(k) == v for k, v in zip(keys, values)) for item in candidates)
 
-            if not any(is_match(item) for item in superset_items if isinstance(item, Mapping)):
+            if not found:
                 return False
 
         return True
@@ -1,15 +1,20 @@
-import json
+import heapq
+import os
+import sys
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from .formatter import Formatter
+from .utils import Utils
 from .models import (
     ArtistFolderParams,
     FileParams,
     PostFolderParams,
     ValidationLevel,
     ValidationData,
+    ValidationReport,
     ValidationArtistData,
     ValidationPostData,
     ValidationFileData,
@@ -17,6 +22,49 @@ from .models import (
 )
 
 
+# Folder names only depend on these fields, so repeated validations reuse them
+
+@lru_cache(maxsize=4096)
+def _cached_artist_folder(service: str, name: str, alias: str, user_id: str, last_date: str, template: str) -> Path:
+    params = ArtistFolderParams(service=service, name=name, alias=alias, user_id=user_id, last_date=last_date)
+    return Formatter.format_artist_folder(params, template)
+
+
+@lru_cache(maxsize=65536)
+def _cached_post_folder(id: str, user: str, service: str, title: str, published: str,
+                        template: str, date_format: str) -> str:
+    params = PostFolderParams(id=id, user=user, service=service, title=title, published=published)
+    return Formatter.format_post_folder(params, template, date_format)
+
+
+# File names depend on their index within the post, so they are cached per post's name list
+@lru_cache(maxsize=65536)
+def _cached_file_names(file_names: Tuple[str, ...], template: str, rename_images_only: bool,
+                       image_extensions: FrozenSet[str]) -> Tuple[str, ...]:
+    return tuple(Formatter.format_files_names(list(file_names), template, rename_images_only, image_extensions))
+
+
+def _intern(value):
+    """Intern strings that repeat across many artists/posts (services, users, templates)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+# Characters that make a name more than a single path component
+_NAME_BREAKERS = tuple(c for c in (os.sep, os.altsep, ':' if os.name == 'nt' else None) if c)
+
+
+def _join_name(base: str, name) -> str:
+    """Return str(Path(base) / name) for a normalized base path string
+
+    Plain names, as produced by the formatter, are appended with the separator
+    directly; anything else is left to Path.
+    """
+    if (type(name) is str and name and name != '.' and base != '.'
+            and not any(c in name for c in _NAME_BREAKERS)):
+        return base + name if base.endswith(os.sep) else f"{base}{os.sep}{name}"
+    return str(Path(base) / name)
+
+
 class Validator:
     """Three-level path conflict validator with ignore management
 
@@ -28,6 +76,10 @@ class Validator:
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.ignore_file = self.data_dir / "validation_ignore.json"
+        # (mtime_ns, size, content hash) of the ignore file as last read or written
+        self._ignore_hash: Optional[Tuple[int, int, int]] = None
+        # Parsed ignore data matching _ignore_hash, reused while the file is unchanged
+        self._ignore_data: Optional[Dict] = None
 
     # ==================== Public API ====================
 
@@ -35,45 +87,45 @@ class Validator:
         self,
         validation_data: ValidationData,
         level: ValidationLevel = None,
-    ) -> Tuple[List[tuple], int, Path]:
+    ) -> ValidationReport:
         """Validate paths with automatic ignore management
 
-        Returns: (filtered_conflicts, filtered_count)
+        Returns: ValidationReport with the filtered conflicts and the post/file counts
         """
+        # Nothing to validate: leave the ignore file alone
+        if not validation_data.artists or (
+                level is not None and not (level.artist_unique or level.post_unique or level.file_unique)):
+            return ValidationReport(
+                conflicts=[],
+                filtered_count=0,
+                total_posts=validation_data.total_posts,
+                total_files=validation_data.total_files,
+            )
+
         # Get download_dir from first artist
-        download_dir = validation_data.artists[0].config.download_dir if validation_data.artists else ""
+        download_dir = validation_data.artists[0].config.download_dir
 
         # Perform validation
         all_conflicts = self._validate_full_paths(validation_data, level)
 
         # Load all ignores
-        if not self.ignore_file.exists():
-            all_data = {}
-        else:
-            try:
-                with open(self.ignore_file, 'r', encoding='utf-8') as f:
-                    all_data = json.load(f)
-                    if not isinstance(all_data, dict):
-                        all_data = {}
-            except Exception:
-                all_data = {}
+        all_data = self.load_ignore_data()
 
         # Load ignores for each artist and filter conflicts
         artist_ignores = {}
-        all_ignored_paths = []
+        all_ignored_paths = set()
         for artist_data in validation_data.artists:
             artist_data_dict = all_data.get(artist_data.id, {})
             ignored_relative = artist_data_dict.get('ignores', [])
             # Convert relative paths to absolute for filtering
             ignored_absolute = [str(Path(download_dir) / p) for p in ignored_relative]
             artist_ignores[artist_data.id] = ignored_relative
-            all_ignored_paths.extend(ignored_absolute)
+            all_ignored_paths.update(ignored_absolute)
 
         # Filter conflicts
         original_count = len(all_conflicts)
         if all_ignored_paths:
-            ignored_set = set(all_ignored_paths)
-            filtered_conflicts = [(path, ids) for path, ids in all_conflicts if path not in ignored_set]
+            filtered_conflicts = [(path, ids) for path, ids in all_conflicts if path not in all_ignored_paths]
         else:
             filtered_conflicts = all_conflicts
         filtered_count = original_count - len(filtered_conflicts)
@@ -82,16 +134,17 @@ class Validator:
         artist_conflicts = defaultdict(list)
         for path, ids in filtered_conflicts:
             if ids:
-                artist_id = ids[0].split(':')[0]
+                artist_id = ids[0][0]
                 artist_conflicts[artist_id].append((path, ids))
 
         # Update JSON for all validated artists
+        download_prefix = self._dir_prefix(download_dir)
         for artist_data in validation_data.artists:
             artist_id = artist_data.id
             artist_conflict_list = artist_conflicts.get(artist_id, [])
             # Strip download_dir from conflict paths
             conflict_paths_relative = [
-                self._strip_download_dir(path, download_dir)
+                self._strip_download_dir(path, download_dir, download_prefix)
                 for path, _ in artist_conflict_list
             ]
             ignored_paths = artist_ignores.get(artist_id, [])
@@ -101,9 +154,11 @@ class Validator:
             existing_ignores = existing_data.get('ignores', [])
             conflicts_set = set(conflict_paths_relative)
             merged_ignores = [path for path in existing_ignores if path in conflicts_set]
+            seen = set(merged_ignores)
             for path in ignored_paths:
-                if path not in merged_ignores:
+                if path not in seen:
                     merged_ignores.append(path)
+                    seen.add(path)
 
             all_data[artist_id] = {
                 "artist_id": artist_id,
@@ -113,87 +168,151 @@ class Validator:
             }
 
         # Save all data
-        with open(self.ignore_file, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False)
+        self.save_ignore_data(all_data)
 
-        return filtered_conflicts, filtered_count
+        return ValidationReport(
+            conflicts=filtered_conflicts,
+            filtered_count=filtered_count,
+            total_posts=validation_data.total_posts,
+            total_files=validation_data.total_files,
+        )
 
     def get_ignore_file_path(self) -> str:
         return self.ignore_file
 
     def load_ignore_data(self) -> Dict:
-        """Load validation ignore data for editing"""
-        if not self.ignore_file.exists():
+        """Load validation ignore data for editing
+
+        The parsed data is cached and reused while the file's mtime and size are
+        unchanged; callers get a shallow copy they may modify at the top level.
+        """
+        try:
+            stat = self.ignore_file.stat()
+        except FileNotFoundError:
             return {}
 
+        known = self._ignore_hash
+        if (self._ignore_data is not None and known
+                and (stat.st_mtime_ns, stat.st_size) == known[:2]):
+            return dict(self._ignore_data)
+
         try:
-            with open(self.ignore_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data if isinstance(data, dict) else {}
+            raw = self.ignore_file.read_bytes()
+            data = Utils.json_loads(raw)
         except Exception:
             return {}
+        if not isinstance(data, dict):
+            return {}
+        self._ignore_hash = (stat.st_mtime_ns, stat.st_size, hash(raw))
+        self._ignore_data = data
+        return dict(data)
 
     def save_ignore_data(self, data: Dict):
-        """Save validation ignore data after editing"""
-        with open(self.ignore_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        """Save validation ignore data, skipping the write if the file already has this content"""
+        raw = Utils.json_dumps(data)
+        digest = hash(raw)
+        known = self._ignore_hash
+        if known and known[2] == digest:
+            try:
+                stat = self.ignore_file.stat()
+                if (stat.st_mtime_ns, stat.st_size) == known[:2]:
+                    return
+            except FileNotFoundError:
+                pass
+        # Write to a temp file and swap it in, so a crash never leaves a truncated file
+        temp_path = self.ignore_file.with_suffix(self.ignore_file.suffix + '.tmp')
+        temp_path.write_bytes(raw)
+        temp_path.replace(self.ignore_file)
+        stat = self.ignore_file.stat()
+        self._ignore_hash = (stat.st_mtime_ns, stat.st_size, digest)
+        self._ignore_data = dict(data)
 
     # ==================== Builder ====================
 
     @staticmethod
-    def build_validation_data(artists_with_posts, global_config) -> ValidationData:
-        """Build ValidationData from artists and their posts"""
+    def build_validation_data(artists_with_posts, global_config,
+                              include_posts: bool = True, include_files: bool = True) -> ValidationData:
+        """Build ValidationData from artists and their posts
+
+        With include_posts/include_files off, post and file entries are left out
+        (still counted); use this when the validation level does not check them.
+        """
         validation_artists = []
+        total_posts = 0
+        total_files = 0
 
         # Helper lambda to get config value from object or dict
         get_config = lambda key: getattr(global_config, key) if hasattr(global_config, key) else global_config[key]
 
+        # Global values are the same for every artist; read them once
+        download_dir = get_config('download_dir')
+        artist_folder_template = _intern(get_config('artist_folder_template'))
+        post_folder_template = _intern(get_config('post_folder_template'))
+        file_template = _intern(get_config('file_template'))
+        date_format = _intern(get_config('date_format'))
+        rename_images_only = get_config('rename_images_only')
+        image_extensions = get_config('image_extensions')
+
         for artist, posts in artists_with_posts:
             # Merge global config with artist-specific config
+            overrides = artist.config
             artist_config = ValidationConfig(
-                download_dir=get_config('download_dir'),
-                artist_folder_template=artist.config.get('artist_folder_template', get_config('artist_folder_template')),
-                post_folder_template=artist.config.get('post_folder_template', get_config('post_folder_template')),
-                file_template=artist.config.get('file_template', get_config('file_template')),
-                date_format=get_config('date_format'),
-                rename_images_only=get_config('rename_images_only'),
-                image_extensions=get_config('image_extensions'),
+                download_dir=download_dir,
+                artist_folder_template=(_intern(overrides['artist_folder_template'])
+                                        if 'artist_folder_template' in overrides else artist_folder_template),
+                post_folder_template=(_intern(overrides['post_folder_template'])
+                                      if 'post_folder_template' in overrides else post_folder_template),
+                file_template=_intern(overrides['file_template']) if 'file_template' in overrides else file_template,
+                date_format=date_format,
+                rename_images_only=rename_images_only,
+                image_extensions=image_extensions,
             )
 
             # Build posts data
             validation_posts = []
+            post_count = 0
             for post in posts:
+                has_file = bool(hasattr(post, 'file') and post.file)
+                attachments = post.attachments if hasattr(post, 'attachments') and post.attachments else []
+                file_count = has_file + len(attachments)
+                if not file_count:
+                    continue
+                post_count += 1
+                total_files += file_count
+                if not include_posts:
+                    continue
+
                 # Collect files
                 files = []
-                if hasattr(post, 'file') and post.file:
-                    files.append(ValidationFileData(name=post.file.get('name', ''), idx=0))
-                if hasattr(post, 'attachments') and post.attachments:
-                    for idx, attachment in enumerate(post.attachments, start=1 if (hasattr(post, 'file') and post.file) else 0):
+                if include_files:
+                    if has_file:
+                        files.append(ValidationFileData(name=post.file.get('name', ''), idx=0))
+                    for idx, attachment in enumerate(attachments, start=1 if has_file else 0):
                         files.append(ValidationFileData(name=attachment.get('name', ''), idx=idx))
 
-                if files:
-                    validation_posts.append(ValidationPostData(
-                        id=post.id,
-                        user=post.user,
-                        service=post.service,
-                        title=post.title,
-                        published=post.published,
-                        files=files,
-                    ))
-
-            if validation_posts:
+                validation_posts.append(ValidationPostData(
+                    id=post.id,
+                    user=_intern(post.user),
+                    service=_intern(post.service),
+                    title=post.title,
+                    published=post.published,
+                    files=files,
+                ))
+
+            if post_count:
+                total_posts += post_count
                 validation_artists.append(ValidationArtistData(
                     id=artist.id,
-                    service=artist.service,
+                    service=_intern(artist.service),
                     name=artist.name,
                     alias=artist.alias,
-                    user_id=artist.user_id,
+                    user_id=_intern(artist.user_id),
                     last_date=artist.last_date or "",
                     posts=validation_posts,
                     config=artist_config,
                 ))
 
-        return ValidationData(artists=validation_artists)
+        return ValidationData(artists=validation_artists, total_posts=total_posts, total_files=total_files)
 
     # ==================== Simple Validators (for testing) ====================
 
@@ -254,115 +373,117 @@ class Validator:
     # ==================== Internal Validation Logic ====================
 
     @staticmethod
-    def _validate_artist_level(validation_data: ValidationData) -> List[tuple]:
-        """Validate artist folder uniqueness"""
-        artist_path_to_ids = defaultdict(list)
+    def _artist_folders(validation_data: ValidationData) -> Dict[str, Path]:
+        """Format each artist's folder name once, by artist ID"""
+        return {
+            artist.id: _cached_artist_folder(
+                artist.service, artist.name, artist.alias, artist.user_id, artist.last_date,
+                artist.config.artist_folder_template,
+            )
+            for artist in validation_data.artists
+        }
 
+    @staticmethod
+    def _post_folders(validation_data: ValidationData) -> Dict[str, List[str]]:
+        """Format post folder names once, by artist ID, in the order of artist.posts"""
+        post_folders = {}
         for artist in validation_data.artists:
-            artist_params = ArtistFolderParams(
-                service=artist.service,
-                name=artist.name,
-                alias=artist.alias,
-                user_id=artist.user_id,
-                last_date=artist.last_date,
-            )
-            artist_folder = Formatter.format_artist_folder(
-                artist_params, artist.config.artist_folder_template
-            )
-            artist_path = Path(artist.config.download_dir) / artist_folder
-            artist_path_to_ids[str(artist_path)].append(artist.id)
+            template = artist.config.post_folder_template
+            date_format = artist.config.date_format
+            post_folders[artist.id] = [
+                _cached_post_folder(post.id, post.user, post.service, post.title, post.published, template, date_format)
+                for post in artist.posts
+            ]
+        return post_folders
 
-        return [
-            (path, artist_ids)
-            for path, artist_ids in artist_path_to_ids.items()
-            if len(artist_ids) > 1
-        ]
+    @staticmethod
+    def _collect_conflicts(entries) -> List[tuple]:
+        """Group (path, id) entries by path, keeping only paths that occur more than once
+
+        Ids are tuples starting with the artist id: (artist_id,), (artist_id, post_id)
+        or (artist_id, post_id, file_name) depending on the level.
+
+        Paths seen once stay in a plain dict; a list is only built on the second hit.
+        Conflicts are returned by descending id count, ties in order of each path's
+        first occurrence.
+        """
+        seen = {}       # path -> (position, id) for paths seen once
+        conflicts = {}  # path -> (position of first occurrence, ids)
+        for position, (path, item_id) in enumerate(entries):
+            if path in conflicts:
+                conflicts[path][1].append(item_id)
+            elif path in seen:
+                first_position, first_id = seen.pop(path)
+                conflicts[path] = (first_position, [first_id, item_id])
+            else:
+                seen[path] = (position, item_id)
+
+        ordered = sorted(conflicts.items(), key=lambda x: (-len(x[1][1]), x[1][0]))
+        return [(path, ids) for path, (_, ids) in ordered]
 
     @staticmethod
-    def _validate_post_level(validation_data: ValidationData) -> List[tuple]:
+    def _validate_artist_level(validation_data: ValidationData,
+                               artist_folders: Optional[Dict[str, Path]] = None) -> List[tuple]:
+        """Validate artist folder uniqueness"""
+        if artist_folders is None:
+            artist_folders = Validator._artist_folders(validation_data)
+
+        return Validator._collect_conflicts(
+            (str(Path(artist.config.download_dir) / artist_folders[artist.id]), (artist.id,))
+            for artist in validation_data.artists
+        )
+
+    @staticmethod
+    def _validate_post_level(validation_data: ValidationData,
+                             artist_folders: Optional[Dict[str, Path]] = None,
+                             post_folders: Optional[Dict[str, List[str]]] = None) -> List[tuple]:
         """Validate post folder uniqueness"""
-        post_path_to_ids = defaultdict(list)
+        if artist_folders is None:
+            artist_folders = Validator._artist_folders(validation_data)
+        if post_folders is None:
+            post_folders = Validator._post_folders(validation_data)
 
-        for artist in validation_data.artists:
-            artist_params = ArtistFolderParams(
-                service=artist.service,
-                name=artist.name,
-                alias=artist.alias,
-                user_id=artist.user_id,
-                last_date=artist.last_date,
-            )
-            artist_folder = Formatter.format_artist_folder(
-                artist_params, artist.config.artist_folder_template
-            )
+        def entries():
+            for artist in validation_data.artists:
+                artist_path = str(Path(artist.config.download_dir) / artist_folders[artist.id])
 
-            for post in artist.posts:
-                post_params = PostFolderParams(
-                    id=post.id,
-                    user=post.user,
-                    service=post.service,
-                    title=post.title,
-                    published=post.published,
-                )
-                post_folder = Formatter.format_post_folder(
-                    post_params, artist.config.post_folder_template, artist.config.date_format
-                )
-                post_path = Path(artist.config.download_dir) / artist_folder / post_folder
-                post_path_to_ids[str(post_path)].append(f"{artist.id}:{post.id}")
-
-        return [
-            (path, post_ids)
-            for path, post_ids in post_path_to_ids.items()
-            if len(post_ids) > 1
-        ]
+                for post, post_folder in zip(artist.posts, post_folders[artist.id]):
+                    yield _join_name(artist_path, post_folder), (artist.id, post.id)
+
+        return Validator._collect_conflicts(entries())
 
     @staticmethod
-    def _validate_file_level(validation_data: ValidationData) -> List[tuple]:
+    def _validate_file_level(validation_data: ValidationData,
+                             artist_folders: Optional[Dict[str, Path]] = None,
+                             post_folders: Optional[Dict[str, List[str]]] = None) -> List[tuple]:
         """Validate file path uniqueness"""
-        file_path_to_info = defaultdict(list)
-
-        for artist in validation_data.artists:
-            artist_params = ArtistFolderParams(
-                service=artist.service,
-                name=artist.name,
-                alias=artist.alias,
-                user_id=artist.user_id,
-                last_date=artist.last_date,
-            )
-            artist_folder = Formatter.format_artist_folder(
-                artist_params, artist.config.artist_folder_template
-            )
-
-            for post in artist.posts:
-                post_params = PostFolderParams(
-                    id=post.id,
-                    user=post.user,
-                    service=post.service,
-                    title=post.title,
-                    published=post.published,
-                )
-                post_folder = Formatter.format_post_folder(
-                    post_params, artist.config.post_folder_template, artist.config.date_format
-                )
-
-                # Format all file names at once
-                file_names = [file.name for file in post.files]
-                formatted_names = Formatter.format_files_names(
-                    file_names,
-                    artist.config.file_template,
-                    artist.config.rename_images_only,
-                    artist.config.image_extensions,
-                )
-
-                for file, filename in zip(post.files, formatted_names):
-                    full_path = Path(artist.config.download_dir) / artist_folder / post_folder / filename
-                    file_info = f"{artist.id}:{post.id}:{file.name}"
-                    file_path_to_info[str(full_path)].append(file_info)
-
-        return [
-            (path, file_infos)
-            for path, file_infos in file_path_to_info.items()
-            if len(file_infos) > 1
-        ]
+        if artist_folders is None:
+            artist_folders = Validator._artist_folders(validation_data)
+        if post_folders is None:
+            post_folders = Validator._post_folders(validation_data)
+
+        def entries():
+            for artist in validation_data.artists:
+                artist_path = str(Path(artist.config.download_dir) / artist_folders[artist.id])
+                file_template = artist.config.file_template
+                rename_images_only = artist.config.rename_images_only
+                image_extensions = frozenset(artist.config.image_extensions)
+
+                for post, post_folder in zip(artist.posts, post_folders[artist.id]):
+                    post_path = _join_name(artist_path, post_folder)
+
+                    # Format all file names at once
+                    formatted_names = _cached_file_names(
+                        tuple(file.name for file in post.files),
+                        file_template,
+                        rename_images_only,
+                        image_extensions,
+                    )
+
+                    for file, filename in zip(post.files, formatted_names):
+                        yield _join_name(post_path, filename), (artist.id, post.id, file.name)
+
+        return Validator._collect_conflicts(entries())
 
     @staticmethod
     def _validate_full_paths(validation_data: ValidationData, level: ValidationLevel = None) -> List[tuple]:
@@ -370,20 +491,39 @@ class Validator:
         if level is None:
             level = ValidationLevel()
 
-        conflicts = []
+        # Folder names are shared by all levels; format them once
+        artist_folders = Validator._artist_folders(validation_data)
+        post_folders = Validator._post_folders(validation_data) if level.post_unique or level.file_unique else None
+
+        level_conflicts = []
         if level.artist_unique:
-            conflicts.extend(Validator._validate_artist_level(validation_data))
+            level_conflicts.append(Validator._validate_artist_level(validation_data, artist_folders))
         if level.post_unique:
-            conflicts.extend(Validator._validate_post_level(validation_data))
+            level_conflicts.append(Validator._validate_post_level(validation_data, artist_folders, post_folders))
         if level.file_unique:
-            conflicts.extend(Validator._validate_file_level(validation_data))
+            level_conflicts.append(Validator._validate_file_level(validation_data, artist_folders, post_folders))
 
-        conflicts.sort(key=lambda x: len(x[1]), reverse=True)
-        return conflicts
+        # Each level is already sorted by count; merge keeps level order for ties
+        return list(heapq.merge(*level_conflicts, key=lambda x: -len(x[1])))
 
     @staticmethod
-    def _strip_download_dir(path: str, download_dir: str) -> str:
-        """Remove download_dir prefix from path"""
+    def _dir_prefix(download_dir: str) -> str:
+        """Return download_dir as it starts the paths built under it, with a trailing separator"""
+        prefix = str(Path(download_dir))
+        return prefix if prefix.endswith(os.sep) else prefix + os.sep
+
+    @staticmethod
+    def _strip_download_dir(path: str, download_dir: str, prefix: Optional[str] = None) -> str:
+        """Remove download_dir prefix from path
+
+        Paths built under download_dir are cut with a plain prefix check;
+        anything else goes through Path.relative_to.
+        """
+        if prefix is None:
+            prefix = Validator._dir_prefix(download_dir)
+        if len(path) > len(prefix) and path.startswith(prefix):
+            return path[len(prefix):]
+
         path_obj = Path(path)
         download_dir_obj = Path(download_dir)
         try:
@@ -0,0 +1,33 @@
+from src.migrator import Migrator
+from src.models import MigrationPlan, MigrationType
+
+
+def _plan(mappings):
+    return MigrationPlan(
+        migration_type=MigrationType.POST,
+        total_items=len(mappings),
+        mappings=mappings,
+        conflicts=[],
+        skipped=[],
+        success_count=len(mappings),
+        conflict_count=0,
+        skipped_count=0,
+    )
+
+
+def test_execute_migration_chained_mappings(tmp_path):
+    """A target that is another mapping's source is renamed in plan order"""
+    a, b, c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+    a.mkdir()
+    b.mkdir()
+    (a / "from_a.txt").write_text("a")
+    (b / "from_b.txt").write_text("b")
+
+    plan = _plan([(str(b), str(c), "2"), (str(a), str(b), "1")])
+    result = Migrator(storage=None, cache=None).execute_migration(plan)
+
+    assert result.success == 2
+    assert result.failed == []
+    assert not a.exists()
+    assert (b / "from_a.txt").read_text() == "a"
+    assert (c / "from_b.txt").read_text() == "b"